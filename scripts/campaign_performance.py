@@ -12,304 +12,397 @@ Direct Usage:
 Features:
     - Yesterday's campaign report
     - 30-day monthly campaign report
+    - Both reports with their GA4 queries run concurrently
     - CSV and PDF export
     - Top pages per campaign
     - Daily performance breakdowns
 """
 
-import os
-from datetime import datetime, timedelta
-import pandas as pd
-from google.analytics.data_v1beta.types import OrderBy
+import contextlib
+import csv
+import heapq
+import io
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from google.analytics.data_v1beta.types import OrderBy, Filter, FilterExpression, FilterExpressionList
 
-from src.config import REPORTS_DIR
-from src.ga4_client import run_report, create_date_range, get_yesterday_date, get_last_30_days_range, get_report_filename
+from src.ga4_client import iter_report_rows, create_date_range, get_yesterday_date, get_last_30_days_range, get_report_filename
 from src.pdf_generator import create_campaign_report_pdf
 
-def get_campaign_report_yesterday():
-    """Get campaign performance report for yesterday"""
-
-    # Get yesterday's date
-    yesterday = get_yesterday_date()
-
-    print(f"📊 Generating campaign performance report for {yesterday}")
-    print("=" * 80)
-
-    # Get campaign data for yesterday
-    date_range = create_date_range(yesterday, yesterday)
-
-    response = run_report(
-        dimensions=["sessionCampaignName", "sessionSourceMedium", "pagePath"],
-        metrics=["totalUsers", "sessions", "screenPageViews", "averageSessionDuration", "bounceRate"],
-        date_ranges=[date_range],
-        order_bys=[
-            OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)
-        ],
-        limit=5000,
+# Console separators
+SEPARATOR = "=" * 80
+WIDE_SEPARATOR = "=" * 100
+
+# Campaigns listed individually in the console report
+DISPLAY_CAMPAIGNS = 20
+
+# Rows the reports always skip, dropped by GA4 before they are sent:
+# campaigns without a name and /sold/ pages, which no longer exist
+CAMPAIGN_SET_FILTER = FilterExpression(
+    not_expression=FilterExpression(
+        filter=Filter(
+            field_name="sessionCampaignName",
+            string_filter=Filter.StringFilter(
+                match_type=Filter.StringFilter.MatchType.EXACT,
+                value="(not set)"
+            )
+        )
     )
-
-    if response.row_count == 0:
-        print("❌ No campaign data found for yesterday.")
-        return
-
-    print(f"✅ Retrieved {response.row_count} campaign records for yesterday")
-
-    # Process data into campaign-focused format
-    campaign_data = {}
-
-    for row in response.rows:
-        campaign_name = row.dimension_values[0].value
-        source_medium = row.dimension_values[1].value
-        page_path = row.dimension_values[2].value
-        users = int(row.metric_values[0].value)
-        sessions = int(row.metric_values[1].value)
-        pageviews = int(row.metric_values[2].value)
-        avg_session_duration = float(row.metric_values[3].value)
-        bounce_rate = float(row.metric_values[4].value)
-
-        # Skip entries with no campaign name
-        if not campaign_name or campaign_name == '(not set)':
-            continue
-
-        # Skip /sold/ pages as they no longer exist
-        if page_path.startswith('/sold/'):
-            continue
-
-        if campaign_name not in campaign_data:
-            campaign_data[campaign_name] = {
-                'total_users': 0,
-                'total_sessions': 0,
-                'total_pageviews': 0,
-                'source_medium': source_medium,
-                'pages': {}
-            }
-
-        campaign_data[campaign_name]['total_users'] += users
-        campaign_data[campaign_name]['total_sessions'] += sessions
-        campaign_data[campaign_name]['total_pageviews'] += pageviews
-
-        if page_path not in campaign_data[campaign_name]['pages']:
-            campaign_data[campaign_name]['pages'][page_path] = {
-                'users': 0,
-                'sessions': 0,
-                'pageviews': 0,
-                'avg_session_duration': avg_session_duration,
-                'bounce_rate': bounce_rate
-            }
-
-        campaign_data[campaign_name]['pages'][page_path]['users'] += users
-        campaign_data[campaign_name]['pages'][page_path]['sessions'] += sessions
-        campaign_data[campaign_name]['pages'][page_path]['pageviews'] += pageviews
-
-    # Sort campaigns by total users
-    sorted_campaigns = sorted(campaign_data.items(), key=lambda x: x[1]['total_users'], reverse=True)
-
-    # Display results
-    print(f"\n📈 CAMPAIGN PERFORMANCE REPORT ({yesterday})")
-    print("=" * 100)
+)
+UNSOLD_PAGE_FILTER = FilterExpression(
+    not_expression=FilterExpression(
+        filter=Filter(
+            field_name="pagePath",
+            string_filter=Filter.StringFilter(
+                match_type=Filter.StringFilter.MatchType.BEGINS_WITH,
+                value="/sold/",
+                case_sensitive=True
+            )
+        )
+    )
+)
+
+# GA4 query parts, built once and shared by every request
+YESTERDAY_DIMENSIONS = ["sessionCampaignName", "sessionSourceMedium", "pagePath"]
+YESTERDAY_METRICS = ["totalUsers", "sessions", "screenPageViews", "averageSessionDuration", "bounceRate"]
+YESTERDAY_ORDER_BYS = [OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)]
+MONTHLY_DIMENSIONS = ["sessionCampaignName", "sessionSourceMedium", "date"]
+MONTHLY_METRICS = ["totalUsers", "sessions", "screenPageViews"]
+MONTHLY_ORDER_BYS = [
+    OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="sessionCampaignName"), desc=False),
+    OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date"), desc=False)
+]
+YESTERDAY_FILTER = FilterExpression(
+    and_group=FilterExpressionList(expressions=[CAMPAIGN_SET_FILTER, UNSOLD_PAGE_FILTER])
+)
+
+# CSV export columns; rows are written as tuples in this order
+YESTERDAY_CSV_COLUMNS = [
+    'Date', 'Campaign_Name', 'Source_Medium', 'Page_Path', 'Users', 'Sessions',
+    'Pageviews', 'Avg_Session_Duration', 'Bounce_Rate', 'Campaign_Total_Users'
+]
+MONTHLY_CSV_COLUMNS = [
+    'Date', 'Campaign_Name', 'Source_Medium', 'Users', 'Sessions', 'Pageviews', 'Campaign_Total_Users'
+]
+
+def new_page():
+    """Empty per-page totals; duration and bounce rate are filled from the first row"""
+    return {
+        'users': 0,
+        'sessions': 0,
+        'pageviews': 0,
+        'avg_session_duration': None,
+        'bounce_rate': None
+    }
+
+def new_page_campaign():
+    """Empty campaign entry for the page-level (yesterday) report"""
+    return {
+        'total_users': 0,
+        'total_sessions': 0,
+        'total_pageviews': 0,
+        'source_medium': None,
+        'pages': defaultdict(new_page)
+    }
+
+def new_daily_campaign():
+    """Empty campaign entry for the daily (monthly) report"""
+    return {
+        'source_medium': None,
+        'daily_data': {},
+        'total_users': 0,
+        'total_sessions': 0,
+        'total_pageviews': 0
+    }
+
+def print_top_pages(rank, data):
+    """Show the top pages of a campaign"""
+    sorted_pages = heapq.nlargest(5, data['pages'].items(), key=lambda x: x[1]['users'])
+    if sorted_pages:
+        print("   Top Pages:")
+        for page_path, page_data in sorted_pages:
+            percentage = (page_data['users'] / data['total_users'] * 100)
+            page_label = page_path if len(page_path) <= 50 else page_path[:50] + '...'
+            print(f"     • {page_label} - {page_data['users']:,} users ({percentage:.1f}%)")
+
+def print_daily_breakdown(rank, data):
+    """Show days active, plus the last 7 days for the top 5 campaigns"""
+    print(f"   Days Active: {len(data['daily_data'])}")
+
+    if rank <= 5:
+        print("   Daily Performance:")
+        sorted_dates = sorted(data['daily_data'].items())
+        for date, daily_data in sorted_dates[-7:]:  # Show last 7 days
+            print(f"     • {date}: {daily_data['users']:,} users, {daily_data['sessions']:,} sessions")
+
+def print_campaign_summaries(campaign_data, title, print_details):
+    """Print the top 20 campaigns and return (grand_total_users, campaign_count)"""
+    # Build the listing in memory and write it in one call rather than one per line
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        totals = print_campaign_listing(campaign_data, title, print_details)
+    sys.stdout.write(buffer.getvalue())
+    return totals
+
+def print_campaign_listing(campaign_data, title, print_details):
+    """Print the campaign listing and return (grand_total_users, campaign_count)"""
+    print(f"\n📈 {title}")
+    print(WIDE_SEPARATOR)
 
     grand_total_users = 0
     campaign_count = 0
 
-    for i, (campaign_name, data) in enumerate(sorted_campaigns, 1):
+    # Only the displayed campaigns need ordering, so select them without a full sort
+    top_campaigns = heapq.nlargest(DISPLAY_CAMPAIGNS, campaign_data.items(), key=lambda x: x[1]['total_users'])
+
+    for i, (campaign_name, data) in enumerate(top_campaigns, 1):
         if data['total_users'] > 0:
             print(f"\n🎯 CAMPAIGN {i}: {campaign_name}")
             print(f"   Source/Medium: {data['source_medium']}")
             print(f"   Total Users: {data['total_users']:,}")
             print(f"   Total Sessions: {data['total_sessions']:,}")
             print(f"   Total Pageviews: {data['total_pageviews']:,}")
-
-            # Show top pages for this campaign
-            sorted_pages = sorted(data['pages'].items(), key=lambda x: x[1]['users'], reverse=True)[:5]
-            if sorted_pages:
-                print("   Top Pages:")
-                for page_path, page_data in sorted_pages:
-                    percentage = (page_data['users'] / data['total_users'] * 100)
-                    print(f"     • {page_path[:50]}{'...' if len(page_path) > 50 else ''} - {page_data['users']:,} users ({percentage:.1f}%)")
+            print_details(i, data)
 
             grand_total_users += data['total_users']
             campaign_count += 1
 
-            # Limit display to top 20 campaigns
-            if i >= 20:
-                remaining_campaigns = len(sorted_campaigns) - 20
-                remaining_users = sum(data['total_users'] for _, data in sorted_campaigns[20:])
-                if remaining_campaigns > 0:
-                    print(f"\n... and {remaining_campaigns} more campaigns with {remaining_users:,} total users")
-                break
+    # Summarise the campaigns beyond the top 20
+    remaining_campaigns = len(campaign_data) - len(top_campaigns)
+    if remaining_campaigns > 0 and top_campaigns[-1][1]['total_users'] > 0:
+        remaining_users = (sum(data['total_users'] for data in campaign_data.values())
+                           - sum(data['total_users'] for _, data in top_campaigns))
+        print(f"\n... and {remaining_campaigns} more campaigns with {remaining_users:,} total users")
+
+    return grand_total_users, campaign_count
 
-    print(f"\n{'='*100}")
+def print_report_summary(date_line, campaign_count, grand_total_users):
+    """Print the closing summary block"""
+    print(f"\n{WIDE_SEPARATOR}")
     print("📊 SUMMARY:")
-    print(f"   Date: {yesterday}")
+    print(f"   {date_line}")
     print(f"   Total Campaigns: {campaign_count}")
     print(f"   Total Users Across All Campaigns: {grand_total_users:,}")
 
-    # Export detailed data to CSV
-    csv_data = []
-    for campaign_name, data in sorted_campaigns:
+def sorted_by_total_users(campaign_data):
+    """All campaigns, highest total users first"""
+    return sorted(campaign_data.items(), key=lambda x: x[1]['total_users'], reverse=True)
+
+def yesterday_csv_rows(campaign_data, yesterday):
+    """Yield one CSV row per campaign page, in YESTERDAY_CSV_COLUMNS order"""
+    for campaign_name, data in sorted_by_total_users(campaign_data):
         for page_path, page_data in data['pages'].items():
-            csv_data.append({
-                'Date': str(yesterday),
-                'Campaign_Name': campaign_name,
-                'Source_Medium': data['source_medium'],
-                'Page_Path': page_path,
-                'Users': page_data['users'],
-                'Sessions': page_data['sessions'],
-                'Pageviews': page_data['pageviews'],
-                'Avg_Session_Duration': page_data['avg_session_duration'],
-                'Bounce_Rate': page_data['bounce_rate'],
-                'Campaign_Total_Users': data['total_users']
-            })
-
-    if csv_data:
-        df = pd.DataFrame(csv_data)
-        csv_filename = get_report_filename("campaign_report_yesterday", yesterday)
-        df.to_csv(csv_filename, index=False)
+            yield (
+                str(yesterday), campaign_name, data['source_medium'], page_path,
+                page_data['users'], page_data['sessions'], page_data['pageviews'],
+                page_data['avg_session_duration'], page_data['bounce_rate'], data['total_users']
+            )
+
+def monthly_csv_rows(campaign_data):
+    """Yield one CSV row per campaign day, in MONTHLY_CSV_COLUMNS order"""
+    for campaign_name, data in sorted_by_total_users(campaign_data):
+        for date, daily_data in data['daily_data'].items():
+            yield (
+                date, campaign_name, data['source_medium'],
+                daily_data['users'], daily_data['sessions'], daily_data['pageviews'], data['total_users']
+            )
+
+def export_campaign_report(csv_rows, columns, report_name, date_suffix, campaign_data, grand_total_users, campaign_count):
+    """Stream the detailed CSV rows to disk and write the PDF report"""
+    # Every campaign has at least one page or day, so any campaign means CSV rows
+    if campaign_data:
+        csv_filename = get_report_filename(report_name, date_suffix)
+        # Column types are fixed, so the csv module writes the tuples as-is without
+        # pandas' per-cell type dispatch
+        with open(csv_filename, 'w', newline='', buffering=1 << 20) as csv_file:
+            writer = csv.writer(csv_file, lineterminator='\n')
+            writer.writerow(columns)
+            writer.writerows(csv_rows)
         print(f"\n📄 Detailed data exported to: {csv_filename}")
 
         # Generate PDF report
-        pdf_filename = create_campaign_report_pdf(campaign_data, yesterday, grand_total_users, campaign_count)
+        pdf_filename = create_campaign_report_pdf(campaign_data, date_suffix, grand_total_users, campaign_count)
         print(f"📄 PDF report exported to: {pdf_filename}")
 
-def get_campaign_report_monthly():
-    """Get campaign performance report for the past 30 days"""
-
-    # Get date range for last 30 days
-    start_date, end_date = get_last_30_days_range()
+def query_yesterday_campaigns(yesterday):
+    """Fetch every row of the page-level campaign query for a single day"""
+    date_range = create_date_range(yesterday, yesterday)
 
-    print(f"📊 Generating monthly campaign performance report for {start_date} to {end_date}")
-    print("=" * 80)
+    return list(iter_report_rows(
+        dimensions=YESTERDAY_DIMENSIONS,
+        metrics=YESTERDAY_METRICS,
+        date_ranges=[date_range],
+        order_bys=YESTERDAY_ORDER_BYS,
+        page_size=5000,
+        dimension_filter=YESTERDAY_FILTER,
+    ))
 
-    # Get campaign data for the month
+def query_monthly_campaigns(start_date, end_date):
+    """Fetch every row of the daily campaign query for a date range"""
     date_range = create_date_range(start_date, end_date)
 
-    response = run_report(
-        dimensions=["sessionCampaignName", "sessionSourceMedium", "date"],
-        metrics=["totalUsers", "sessions", "screenPageViews"],
+    return list(iter_report_rows(
+        dimensions=MONTHLY_DIMENSIONS,
+        metrics=MONTHLY_METRICS,
         date_ranges=[date_range],
-        order_bys=[
-            OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="sessionCampaignName"), desc=False),
-            OrderBy(dimension=OrderBy.DimensionOrderBy(dimension_name="date"), desc=False)
-        ],
-        limit=10000,
-    )
+        order_bys=MONTHLY_ORDER_BYS,
+        page_size=10000,
+        dimension_filter=CAMPAIGN_SET_FILTER,
+    ))
 
-    if response.row_count == 0:
-        print("❌ No campaign data found for the date range.")
+def get_campaign_report_yesterday(rows=None, yesterday=None):
+    """Get campaign performance report for yesterday (optionally from already fetched rows)"""
+
+    # Get yesterday's date unless the caller already fixed it
+    if yesterday is None:
+        yesterday = get_yesterday_date()
+
+    print(f"📊 Generating campaign performance report for {yesterday}")
+    print(SEPARATOR)
+
+    # Get campaign data for yesterday
+    if rows is None:
+        rows = query_yesterday_campaigns(yesterday)
+
+    if not rows:
+        print("❌ No campaign data found for yesterday.")
         return
 
-    print(f"✅ Retrieved {response.row_count} campaign records for the month")
+    print(f"✅ Retrieved {len(rows)} campaign records for yesterday")
 
     # Process data into campaign-focused format
-    campaign_data = {}
-
-    for row in response.rows:
-        campaign_name = row.dimension_values[0].value
-        source_medium = row.dimension_values[1].value
-        date = row.dimension_values[2].value
-        users = int(row.metric_values[0].value)
-        sessions = int(row.metric_values[1].value)
-        pageviews = int(row.metric_values[2].value)
-
-        # Skip entries with no campaign name
-        if not campaign_name or campaign_name == '(not set)':
+    campaign_data = defaultdict(new_page_campaign)
+
+    for row in rows:
+        dimension_values = row.dimension_values
+        campaign_name = dimension_values[0].value
+
+        # (not set) and /sold/ rows are filtered out by GA4; skip any empty name
+        if not campaign_name:
             continue
 
-        if campaign_name not in campaign_data:
-            campaign_data[campaign_name] = {
-                'source_medium': source_medium,
-                'daily_data': {},
-                'total_users': 0,
-                'total_sessions': 0,
-                'total_pageviews': 0
-            }
+        source_medium = dimension_values[1].value
+        page_path = dimension_values[2].value
+        metric_values = row.metric_values
+        users = int(metric_values[0].value)
+        sessions = int(metric_values[1].value)
+        pageviews = int(metric_values[2].value)
+        avg_session_duration = float(metric_values[3].value)
+        bounce_rate = float(metric_values[4].value)
+
+        campaign = campaign_data[campaign_name]
+        if campaign['source_medium'] is None:
+            campaign['source_medium'] = source_medium
+        campaign['total_users'] += users
+        campaign['total_sessions'] += sessions
+        campaign['total_pageviews'] += pageviews
+
+        # Duration and bounce rate come from the first row seen for the page
+        page = campaign['pages'][page_path]
+        if page['avg_session_duration'] is None:
+            page['avg_session_duration'] = avg_session_duration
+            page['bounce_rate'] = bounce_rate
+        page['users'] += users
+        page['sessions'] += sessions
+        page['pageviews'] += pageviews
+
+    grand_total_users, campaign_count = print_campaign_summaries(
+        campaign_data, f"CAMPAIGN PERFORMANCE REPORT ({yesterday})", print_top_pages
+    )
+    print_report_summary(f"Date: {yesterday}", campaign_count, grand_total_users)
 
-        campaign_data[campaign_name]['daily_data'][date] = {
-            'users': users,
-            'sessions': sessions,
-            'pageviews': pageviews
-        }
-        campaign_data[campaign_name]['total_users'] += users
-        campaign_data[campaign_name]['total_sessions'] += sessions
-        campaign_data[campaign_name]['total_pageviews'] += pageviews
+    # Export detailed data to CSV
+    export_campaign_report(yesterday_csv_rows(campaign_data, yesterday), YESTERDAY_CSV_COLUMNS, "campaign_report_yesterday", yesterday,
+                           campaign_data, grand_total_users, campaign_count)
 
-    # Sort campaigns by total users
-    sorted_campaigns = sorted(campaign_data.items(), key=lambda x: x[1]['total_users'], reverse=True)
+def get_campaign_report_monthly(rows=None, start_date=None, end_date=None):
+    """Get campaign performance report for the past 30 days (optionally from already fetched rows)"""
 
-    # Display results
-    print(f"\n📈 MONTHLY CAMPAIGN PERFORMANCE REPORT ({start_date} to {end_date})")
-    print("=" * 100)
+    # Get date range for last 30 days unless the caller already fixed it
+    if start_date is None or end_date is None:
+        start_date, end_date = get_last_30_days_range()
 
-    grand_total_users = 0
-    campaign_count = 0
+    print(f"📊 Generating monthly campaign performance report for {start_date} to {end_date}")
+    print(SEPARATOR)
 
-    for i, (campaign_name, data) in enumerate(sorted_campaigns, 1):
-        if data['total_users'] > 0:
-            print(f"\n🎯 CAMPAIGN {i}: {campaign_name}")
-            print(f"   Source/Medium: {data['source_medium']}")
-            print(f"   Total Users: {data['total_users']:,}")
-            print(f"   Total Sessions: {data['total_sessions']:,}")
-            print(f"   Total Pageviews: {data['total_pageviews']:,}")
-            print(f"   Days Active: {len(data['daily_data'])}")
+    # Get campaign data for the month
+    if rows is None:
+        rows = query_monthly_campaigns(start_date, end_date)
 
-            # Show daily breakdown for top campaigns
-            if i <= 5:  # Show daily breakdown for top 5 campaigns
-                print("   Daily Performance:")
-                sorted_dates = sorted(data['daily_data'].items())
-                for date, daily_data in sorted_dates[-7:]:  # Show last 7 days
-                    print(f"     • {date}: {daily_data['users']:,} users, {daily_data['sessions']:,} sessions")
+    if not rows:
+        print("❌ No campaign data found for the date range.")
+        return
 
-            grand_total_users += data['total_users']
-            campaign_count += 1
+    print(f"✅ Retrieved {len(rows)} campaign records for the month")
 
-            # Limit display to top 20 campaigns
-            if i >= 20:
-                remaining_campaigns = len(sorted_campaigns) - 20
-                remaining_users = sum(data['total_users'] for _, data in sorted_campaigns[20:])
-                if remaining_campaigns > 0:
-                    print(f"\n... and {remaining_campaigns} more campaigns with {remaining_users:,} total users")
-                break
+    # Process data into campaign-focused format
+    campaign_data = defaultdict(new_daily_campaign)
 
-    print(f"\n{'='*100}")
-    print("📊 SUMMARY:")
-    print(f"   Date Range: {start_date} to {end_date}")
-    print(f"   Total Campaigns: {campaign_count}")
-    print(f"   Total Users Across All Campaigns: {grand_total_users:,}")
+    for row in rows:
+        dimension_values = row.dimension_values
+        campaign_name = dimension_values[0].value
+
+        # (not set) rows are filtered out by GA4; skip any empty name
+        if not campaign_name:
+            continue
+
+        source_medium = dimension_values[1].value
+        date = dimension_values[2].value
+        metric_values = row.metric_values
+        users = int(metric_values[0].value)
+        sessions = int(metric_values[1].value)
+        pageviews = int(metric_values[2].value)
+
+        campaign = campaign_data[campaign_name]
+        if campaign['source_medium'] is None:
+            campaign['source_medium'] = source_medium
+        campaign['daily_data'][date] = {
+            'users': users,
+            'sessions': sessions,
+            'pageviews': pageviews
+        }
+        campaign['total_users'] += users
+        campaign['total_sessions'] += sessions
+        campaign['total_pageviews'] += pageviews
+
+    grand_total_users, campaign_count = print_campaign_summaries(
+        campaign_data, f"MONTHLY CAMPAIGN PERFORMANCE REPORT ({start_date} to {end_date})", print_daily_breakdown
+    )
+    print_report_summary(f"Date Range: {start_date} to {end_date}", campaign_count, grand_total_users)
 
     # Export detailed data to CSV
-    csv_data = []
-    for campaign_name, data in sorted_campaigns:
-        for date, daily_data in data['daily_data'].items():
-            csv_data.append({
-                'Date': date,
-                'Campaign_Name': campaign_name,
-                'Source_Medium': data['source_medium'],
-                'Users': daily_data['users'],
-                'Sessions': daily_data['sessions'],
-                'Pageviews': daily_data['pageviews'],
-                'Campaign_Total_Users': data['total_users']
-            })
-
-    if csv_data:
-        df = pd.DataFrame(csv_data)
-        csv_filename = get_report_filename("campaign_report_monthly", f"{start_date}_to_{end_date}")
-        df.to_csv(csv_filename, index=False)
-        print(f"\n📄 Detailed data exported to: {csv_filename}")
+    export_campaign_report(monthly_csv_rows(campaign_data), MONTHLY_CSV_COLUMNS, "campaign_report_monthly", f"{start_date}_to_{end_date}",
+                           campaign_data, grand_total_users, campaign_count)
 
-        # Generate PDF report
-        pdf_filename = create_campaign_report_pdf(campaign_data, f"{start_date}_to_{end_date}", grand_total_users, campaign_count)
-        print(f"📄 PDF report exported to: {pdf_filename}")
+def get_all_campaign_reports():
+    """Run both reports, overlapping their GA4 queries"""
+    # Resolve the dates once so the labels always match the rows that were fetched
+    yesterday = get_yesterday_date()
+    start_date, end_date = get_last_30_days_range()
+
+    # The queries are independent network waits; the reports still print one after the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yesterday_future = executor.submit(query_yesterday_campaigns, yesterday)
+        monthly_future = executor.submit(query_monthly_campaigns, start_date, end_date)
+
+        get_campaign_report_yesterday(yesterday_future.result(), yesterday)
+        print()
+        get_campaign_report_monthly(monthly_future.result(), start_date, end_date)
 
 if __name__ == "__main__":
     print("Choose report type:")
     print("1. Yesterday's campaign report")
     print("2. Monthly campaign report")
-    choice = input("Enter choice (1 or 2): ").strip()
+    print("3. Both reports")
+    choice = input("Enter choice (1, 2 or 3): ").strip()
 
     if choice == "1":
         get_campaign_report_yesterday()
     elif choice == "2":
         get_campaign_report_monthly()
+    elif choice == "3":
+        get_all_campaign_reports()
     else:
         print("Invalid choice. Running yesterday's report by default.")
         get_campaign_report_yesterday()
\ No newline at end of file
@@ -115,15 +115,32 @@ def create_database():
                 etag VARCHAR(255),
                 last_modified_header VARCHAR(255),
                 payload MEDIUMTEXT,
+                payload_zstd MEDIUMBLOB,
                 content_hash CHAR(64),
                 content_length INT,
                 status_code INT,
                 fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                INDEX idx_feed_url (feed_url(255)),
+                INDEX idx_feed_url_fetched (feed_url, fetched_at DESC),
                 INDEX idx_fetched_at (fetched_at)
             )
         ''')
 
+        # Latest-entry lookups (WHERE feed_url = ? ORDER BY fetched_at DESC LIMIT 1)
+        # read straight off this index; it also replaces the old feed_url prefix index
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feed_url_fetched ON feed_cache (feed_url, fetched_at DESC)')
+        cursor.execute('DROP INDEX IF EXISTS idx_feed_url ON feed_cache')
+        # zstd-compressed payload (the importer leaves payload NULL when this is set)
+        cursor.execute('ALTER TABLE feed_cache ADD COLUMN IF NOT EXISTS payload_zstd MEDIUMBLOB AFTER payload')
+
+        # Hash of the last imported feed payload (lets unchanged feeds skip the import)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS feed_import_state (
+                feed_url VARCHAR(512) PRIMARY KEY,
+                last_content_hash CHAR(64) NOT NULL,
+                last_imported_at DATETIME NOT NULL
+            )
+        ''')
+
         # Create audiences table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS audiences (
@@ -159,7 +176,7 @@ def create_database():
         conn.commit()
         print("✅ MariaDB database schema created successfully")
         print(f"📊 Database: {MARIADB_CONFIG['database']}")
-        print("📋 Tables created: properties, users, user_access, campaigns, audiences, audience_membership_snapshots, feed_cache")
+        print("📋 Tables created: properties, users, user_access, campaigns, audiences, audience_membership_snapshots, feed_cache, feed_import_state")
         
         cursor.close()
         conn.close()
@@ -3,171 +3,215 @@
 Run with: ddev exec python scripts/email_performance.py
 """
 
-import os
-import sys
 import argparse
-from datetime import datetime, timedelta
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from google.analytics.data_v1beta.types import OrderBy
+from google.analytics.data_v1beta.types import OrderBy, Filter, FilterExpression, FilterExpressionList
 
 from src.pdf_generator import create_campaign_report_pdf
-from src.ga4_client import run_report, create_date_range, get_yesterday_date, get_last_30_days_range, get_report_filename
+from src.ga4_client import iter_report_rows, create_date_range, get_yesterday_date, get_last_30_days_range, report_rows_to_dataframe, load_cached_report_frame, report_cache_name
+
+# Console separators
+SEPARATOR = "=" * 80
+SECTION_SEPARATOR = "-" * 50
+
+# GA4 query parts, built once and shared by every request
+EMAIL_DIMENSIONS = ["sessionCampaignName", "sessionSourceMedium", "pagePath"]
+EMAIL_METRICS = ["totalUsers", "sessions", "screenPageViews", "averageSessionDuration", "bounceRate"]
+TOTAL_USERS_DESC = [OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)]
+
+# Columns of the comprehensive report, in GA4 dimension then metric order
+EMAIL_COLUMNS = ['campaign_name', 'source_medium', 'page_path', 'users', 'sessions',
+                 'pageviews', 'avg_session_duration', 'bounce_rate']
+# Dimensions repeat heavily, so categories give groupby integer keys to work with
+EMAIL_COLUMN_TYPES = {'campaign_name': 'category', 'source_medium': 'category', 'page_path': 'category',
+                      'users': 'int64', 'sessions': 'int64', 'pageviews': 'int64',
+                      'avg_session_duration': 'float64', 'bounce_rate': 'float64'}
+
+# Email sources that get their own report
+REPORTED_CATEGORIES = ('Bailiwick Express', 'Places.je')
+
+# Source/medium patterns checked in order; the first match decides the category
+EMAIL_CATEGORY_PATTERNS = (
+    ('Bailiwick Express', re.compile(r'allislandmedia\.cmail', re.IGNORECASE)),
+    ('Places.je', re.compile(r'places\.je', re.IGNORECASE)),
+    ('Email', re.compile(r'email', re.IGNORECASE)),
+)
+
+# Source/medium substrings requested from GA4 for the comprehensive report
+REPORTED_SOURCE_SUBSTRINGS = ('allislandmedia.cmail', 'places.je')
+
+# Any of these in a source/medium marks it as email-related
+EMAIL_SOURCE_KEYWORDS = ('mailchimp', 'email', 'newsletter', 'mail', 'campaign')
+EMAIL_SOURCE_RE = re.compile('|'.join(map(re.escape, EMAIL_SOURCE_KEYWORDS)), re.IGNORECASE)
+
+# Columns of the email sources report
+EMAIL_SOURCE_COLUMNS = ['source_medium', 'users', 'sessions']
+EMAIL_SOURCE_COLUMN_TYPES = {'users': 'int64', 'sessions': 'int64'}
+
+def source_medium_contains_any(values) -> FilterExpression:
+    """GA4 filter keeping rows whose source/medium contains any of the values (any case)"""
+    return FilterExpression(
+        or_group=FilterExpressionList(
+            expressions=[
+                FilterExpression(
+                    filter=Filter(
+                        field_name="sessionSourceMedium",
+                        string_filter=Filter.StringFilter(
+                            match_type=Filter.StringFilter.MatchType.CONTAINS,
+                            value=value,
+                            case_sensitive=False
+                        )
+                    )
+                )
+                for value in values
+            ]
+        )
+    )
 
 def categorize_email_source(source_medium: str) -> str:
     """Categorize email sources into different providers/campaigns"""
-    source_lower = source_medium.lower()
-
-    # Bailiwick Express campaigns
-    if 'allislandmedia.cmail' in source_lower:
-        return 'Bailiwick Express'
-
-    # Places.je campaigns
-    if 'places.je' in source_lower:
-        return 'Places.je'
-
-    # Other email sources (excluding actual Mailchimp)
-    if 'email' in source_lower:
-        return 'Email'
+    for category, pattern in EMAIL_CATEGORY_PATTERNS:
+        if pattern.search(source_medium):
+            return category
 
     # Don't categorize actual Mailchimp sources
     return 'Other'
 
-def generate_comprehensive_email_reports():
-    """Generate separate reports for different email marketing sources"""
+def categorize_email_sources(source_medium: pd.Series) -> pd.Series:
+    """Vectorized categorize_email_source over a column of source/medium values"""
+    return pd.Series(
+        np.select(
+            [source_medium.str.contains(pattern, na=False) for _, pattern in EMAIL_CATEGORY_PATTERNS],
+            [category for category, _ in EMAIL_CATEGORY_PATTERNS],
+            default='Other',
+        ),
+        index=source_medium.index,
+    )
 
-    print("📧 Generating Comprehensive Email Reports")
-    print("=" * 80)
+def build_campaign_data(df: pd.DataFrame) -> dict:
+    """Aggregate rows per campaign and page into the structure the PDF generator expects"""
+    campaigns = df.groupby('campaign_name', sort=False, observed=True).agg(
+        total_users=('users', 'sum'),
+        total_sessions=('sessions', 'sum'),
+        total_pageviews=('pageviews', 'sum'),
+        source_medium=('source_medium', 'first'),
+    )
+    pages = df.groupby(['campaign_name', 'page_path'], sort=False, observed=True).agg(
+        users=('users', 'sum'),
+        sessions=('sessions', 'sum'),
+        pageviews=('pageviews', 'sum'),
+        avg_session_duration=('avg_session_duration', 'last'),
+        bounce_rate=('bounce_rate', 'last'),
+    )
 
-    # Get yesterday's date
-    yesterday = get_yesterday_date()
+    campaign_data = {
+        campaign_name: {**totals, 'pages': {}}
+        for campaign_name, totals in zip(campaigns.index, campaigns.to_dict('records'))
+    }
+    for (campaign_name, page_path), page_stats in zip(pages.index, pages.to_dict('records')):
+        campaign_data[campaign_name]['pages'][page_path] = page_stats
+    return campaign_data
+
+def query_reported_email_sources(yesterday):
+    """Fetch every row of the page-level query for the reported email sources on a single day"""
     date_range = create_date_range(yesterday, yesterday)
 
-    # Get all email-related data
-    response = run_report(
-        dimensions=["sessionCampaignName", "sessionSourceMedium", "pagePath"],
-        metrics=["totalUsers", "sessions", "screenPageViews", "averageSessionDuration", "bounceRate"],
+    return list(iter_report_rows(
+        dimensions=EMAIL_DIMENSIONS,
+        metrics=EMAIL_METRICS,
+        date_ranges=[date_range],
+        order_bys=TOTAL_USERS_DESC,
+        page_size=5000,
+        # Only the reported email sources come back; categories are still split locally
+        dimension_filter=source_medium_contains_any(REPORTED_SOURCE_SUBSTRINGS),
+    ))
+
+def query_email_sources(start_date, end_date):
+    """Fetch every row of the email-related source/medium query for a date range"""
+    date_range = create_date_range(start_date, end_date)
+
+    return list(iter_report_rows(
+        dimensions=["sessionSourceMedium"],
+        metrics=["totalUsers", "sessions"],
         date_ranges=[date_range],
-        order_bys=[
-            OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)
-        ],
-        limit=5000,
+        order_bys=TOTAL_USERS_DESC,
+        page_size=1000,
+        dimension_filter=source_medium_contains_any(EMAIL_SOURCE_KEYWORDS),
+    ))
+
+def load_reported_email_frame(yesterday, refresh=False):
+    """Rows of the reported email sources for a day, reused from the report cache when fresh"""
+    cache_name = report_cache_name(
+        f"email_sources_{yesterday}",
+        EMAIL_DIMENSIONS, EMAIL_METRICS, REPORTED_SOURCE_SUBSTRINGS, EMAIL_COLUMNS, EMAIL_COLUMN_TYPES,
     )
+    return load_cached_report_frame(
+        cache_name,
+        lambda: report_rows_to_dataframe(query_reported_email_sources(yesterday), EMAIL_COLUMNS, EMAIL_COLUMN_TYPES),
+        refresh=refresh,
+        dtypes=EMAIL_COLUMN_TYPES,
+    )
+
+def generate_comprehensive_email_reports(df=None, yesterday=None, refresh=False):
+    """Generate separate reports for different email marketing sources"""
+
+    print("📧 Generating Comprehensive Email Reports")
+    print(SEPARATOR)
 
-    if response.row_count == 0:
+    # Get yesterday's date unless the caller already fixed it
+    if yesterday is None:
+        yesterday = get_yesterday_date()
+
+    # Get data for the reported email sources
+    if df is None:
+        df = load_reported_email_frame(yesterday, refresh)
+
+    if df.empty:
         print("❌ No email data found for yesterday.")
         return
 
-    # Categorize data by email source type
-    categorized_data = {
-        'Bailiwick Express': [],
-        'Places.je': []
-    }
+    categories = categorize_email_sources(df['source_medium'])
+    reported = categories.isin(REPORTED_CATEGORIES)
+    if not reported.any():
+        print("❌ No data from the reported email sources for yesterday.")
+        return
 
-    for row in response.rows:
-        campaign_name = row.dimension_values[0].value
-        source_medium = row.dimension_values[1].value
-        page_path = row.dimension_values[2].value
-
-        category = categorize_email_source(source_medium)
-
-        # Only include if it's Places.je or Bailiwick Express
-        if category in ['Bailiwick Express', 'Places.je']:
-            users = int(row.metric_values[0].value)
-            sessions = int(row.metric_values[1].value)
-            pageviews = int(row.metric_values[2].value)
-            avg_session_duration = float(row.metric_values[3].value)
-            bounce_rate = float(row.metric_values[4].value)
-
-            categorized_data[category].append({
-                'campaign_name': campaign_name,
-                'source_medium': source_medium,
-                'page_path': page_path,
-                'users': users,
-                'sessions': sessions,
-                'pageviews': pageviews,
-                'avg_session_duration': avg_session_duration,
-                'bounce_rate': bounce_rate
-            })
+    df = df[reported].assign(category=categories[reported])
 
     # Generate separate reports for each category with data
-    for category, data in categorized_data.items():
-        if not data:
+    for category in REPORTED_CATEGORIES:
+        data = df[df['category'] == category]
+        if data.empty:
             continue
 
         print(f"\n📧 Processing {category} ({len(data)} records)")
-        print("-" * 50)
-
-        # Process data for this category
-        campaign_data = {}
-        total_users = 0
-        campaign_count = 0
-
-        for row in data:
-            campaign_name = row['campaign_name']
-            page_path = row['page_path']
-            users = row['users']
-            sessions = row['sessions']
-            pageviews = row['pageviews']
-            avg_session_duration = row['avg_session_duration']
-            bounce_rate = row['bounce_rate']
-
-            total_users += users
-
-            # Skip entries with no campaign name
-            if not campaign_name or campaign_name == '(not set)':
-                continue
-
-            # Skip /sold/ pages
-            if page_path.startswith('/sold/'):
-                continue
-
-            if campaign_name not in campaign_data:
-                campaign_data[campaign_name] = {
-                    'total_users': 0,
-                    'total_sessions': 0,
-                    'total_pageviews': 0,
-                    'source_medium': row['source_medium'],  # Add source_medium for PDF generator
-                    'pages': {}
-                }
-                campaign_count += 1
-
-            campaign_data[campaign_name]['total_users'] += users
-            campaign_data[campaign_name]['total_sessions'] += sessions
-            campaign_data[campaign_name]['total_pageviews'] += pageviews
-
-            if page_path not in campaign_data[campaign_name]['pages']:
-                campaign_data[campaign_name]['pages'][page_path] = {
-                    'users': 0,
-                    'sessions': 0,
-                    'pageviews': 0,
-                    'avg_session_duration': 0,
-                    'bounce_rate': 0
-                }
-
-            campaign_data[campaign_name]['pages'][page_path]['users'] += users
-            campaign_data[campaign_name]['pages'][page_path]['sessions'] += sessions
-            campaign_data[campaign_name]['pages'][page_path]['pageviews'] += pageviews
-            campaign_data[campaign_name]['pages'][page_path]['avg_session_duration'] = avg_session_duration
-            campaign_data[campaign_name]['pages'][page_path]['bounce_rate'] = bounce_rate
+        print(SECTION_SEPARATOR)
 
-        if campaign_count > 0:
-            # Collect top pages for this category
-            all_pages = {}
-            for campaign_name, campaign_info in campaign_data.items():
-                for page_path, page_data in campaign_info['pages'].items():
-                    if page_path not in all_pages:
-                        all_pages[page_path] = {'users': 0, 'sessions': 0, 'pageviews': 0}
-                    all_pages[page_path]['users'] += page_data['users']
-                    all_pages[page_path]['sessions'] += page_data['sessions']
-                    all_pages[page_path]['pageviews'] += page_data['pageviews']
+        total_users = int(data['users'].sum())
+
+        # Skip entries with no campaign name and /sold/ pages
+        data = data[
+            (data['campaign_name'] != '')
+            & (data['campaign_name'] != '(not set)')
+            & ~data['page_path'].str.startswith('/sold/')
+        ]
+        campaign_data = build_campaign_data(data)
+        campaign_count = len(campaign_data)
 
+        if campaign_count > 0:
             # Display top 10 pages for this category
-            if all_pages:
-                print(f"\n📄 Top pages visited from {category}:")
-                sorted_pages = sorted(all_pages.items(), key=lambda x: x[1]['users'], reverse=True)
-                for i, (page_path, page_stats) in enumerate(sorted_pages[:10], 1):
-                    print(f"   {i}. {page_path}")
-                    print(f"      Users: {page_stats['users']:,}, Sessions: {page_stats['sessions']:,}, Pageviews: {page_stats['pageviews']:,}")
+            top_pages = (
+                data.groupby('page_path', sort=False, observed=True)[['users', 'sessions', 'pageviews']]
+                .sum()
+                .nlargest(10, 'users')
+            )
+            print(f"\n📄 Top pages visited from {category}:")
+            for i, (page_path, page_stats) in enumerate(top_pages.iterrows(), 1):
+                print(f"   {i}. {page_path}")
+                print(f"      Users: {page_stats['users']:,}, Sessions: {page_stats['sessions']:,}, Pageviews: {page_stats['pageviews']:,}")
 
             # Generate PDF report for this category
             pdf_filename = create_campaign_report_pdf(campaign_data, f"{yesterday}", total_users, campaign_count)
@@ -176,49 +220,27 @@ def generate_comprehensive_email_reports():
         else:
             print(f"⚠️  No valid campaigns found for {category}")
 
-def get_email_sources_report():
+def get_email_sources_report(rows=None, start_date=None, end_date=None):
     """Get a report of all email-related sources to see what's available"""
 
-    # Get date range for last 30 days
-    start_date, end_date = get_last_30_days_range()
+    # Get date range for last 30 days unless the caller already fixed it
+    if start_date is None or end_date is None:
+        start_date, end_date = get_last_30_days_range()
 
     print(f"📧 Analyzing email sources for {start_date} to {end_date}")
-    print("=" * 80)
+    print(SEPARATOR)
 
-    # Get all source/medium combinations
-    date_range = create_date_range(start_date, end_date)
-
-    response = run_report(
-        dimensions=["sessionSourceMedium"],
-        metrics=["totalUsers", "sessions"],
-        date_ranges=[date_range],
-        order_bys=[
-            OrderBy(metric=OrderBy.MetricOrderBy(metric_name="totalUsers"), desc=True)
-        ],
-        limit=1000,
-    )
-
-    if response.row_count == 0:
-        print("❌ No data found for the date range.")
-        return
+    # Get email-related source/medium combinations
+    if rows is None:
+        rows = query_email_sources(start_date, end_date)
 
     print("📧 EMAIL-RELATED SOURCES FOUND:")
-    print("=" * 80)
-
-    email_sources = []
-    for row in response.rows:
-        source_medium = row.dimension_values[0].value
-        users = int(row.metric_values[0].value)
-        sessions = int(row.metric_values[1].value)
-
-        # Check for email-related sources
-        email_keywords = ['mailchimp', 'email', 'newsletter', 'mail', 'campaign']
-        if any(keyword in source_medium.lower() for keyword in email_keywords):
-            email_sources.append({
-                'source_medium': source_medium,
-                'users': users,
-                'sessions': sessions
-            })
+    print(SEPARATOR)
+
+    # Check for email-related sources with one vectorized match over the column
+    df = report_rows_to_dataframe(rows, EMAIL_SOURCE_COLUMNS, EMAIL_SOURCE_COLUMN_TYPES)
+    df = df[df['source_medium'].str.contains(EMAIL_SOURCE_RE)]
+    email_sources = df.to_dict('records')
 
     if not email_sources:
         print("❌ No email-related sources found.")
@@ -235,20 +257,43 @@ def get_email_sources_report():
 
     return email_sources
 
+def run_all_email_reports(refresh=False):
+    """Run both reports, overlapping their GA4 queries"""
+    yesterday = get_yesterday_date()
+    start_date, end_date = get_last_30_days_range()
+
+    # The queries are independent network waits; the reports still print one after the other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        comprehensive_future = executor.submit(load_reported_email_frame, yesterday, refresh)
+        sources_future = executor.submit(query_email_sources, start_date, end_date)
+
+        generate_comprehensive_email_reports(comprehensive_future.result(), yesterday)
+        print()
+        get_email_sources_report(sources_future.result(), start_date, end_date)
+
+# --report-type choices: (announcement, runner taking the parsed arguments)
+REPORT_TYPES = {
+    'comprehensive': ("Running comprehensive email reports (separate reports for each email source)",
+                      lambda args: generate_comprehensive_email_reports(refresh=args.refresh)),
+    'sources': ("Checking available email sources",
+                lambda args: get_email_sources_report()),
+    'all': ("Running comprehensive email reports and checking email sources",
+            lambda args: run_all_email_reports(refresh=args.refresh)),
+}
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Comprehensive Email Campaign Performance Analysis')
     parser.add_argument('--report-type', type=str,
-                       choices=['comprehensive', 'sources'],
+                       choices=list(REPORT_TYPES),
                        default='comprehensive', help='Type of report to generate')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Query GA4 even if a recent cached copy of the report data exists')
 
     args = parser.parse_args()
 
     print("📧 Comprehensive Email Campaign Performance Analysis")
     print("=" * 60)
 
-    if args.report_type == 'comprehensive':
-        print("Running comprehensive email reports (separate reports for each email source)")
-        generate_comprehensive_email_reports()
-    elif args.report_type == 'sources':
-        print("Checking available email sources")
-        get_email_sources_report()
\ No newline at end of file
+    description, run = REPORT_TYPES[args.report_type]
+    print(description)
+    run(args)
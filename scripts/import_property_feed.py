@@ -6,81 +6,136 @@ This script fetches the XML feed from https://api.ndestates.com/feeds/ndefeed.xm
 and populates the properties database with current property listings.
 """
 
+import io
 import sqlite3
+from contextlib import closing
 import os
-import xml.etree.ElementTree as ET
 import requests
 from datetime import datetime
 import time
+from typing import NamedTuple, Optional
+
+try:
+    from lxml import etree as ET
+    # Skip ID indexing, allow very large feeds and only report <property> elements
+    ITERPARSE_OPTIONS = {'tag': 'property', 'huge_tree': True, 'collect_ids': False, 'remove_blank_text': True}
+    # All element children in one C call, leaving out comments and processing instructions
+    child_elements = ET.XPath('./*')
+
+    def release_element(elem):
+        """Clear a parsed element and drop the finished siblings still attached to the root"""
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+except ImportError:
+    import xml.etree.ElementTree as ET
+    ITERPARSE_OPTIONS = {}
+    child_elements = list
+
+    def release_element(elem):
+        """Clear a parsed element (ElementTree has no parent links to prune)"""
+        elem.clear()
 
 # Database file path
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'properties.db')
 XML_FEED_URL = 'https://api.ndestates.com/feeds/ndefeed.xml'
 
+class Property(NamedTuple):
+    """A parsed feed property, fields in properties table column order"""
+    reference: Optional[str]
+    url: Optional[str]
+    property_name: Optional[str]
+    house_name: Optional[str]
+    property_type: Optional[str]
+    price: Optional[float]
+    parish: Optional[str]
+    status: Optional[str]
+    type: Optional[str]  # buy/rent
+    bedrooms: Optional[int]
+    bathrooms: Optional[int]
+    receptions: Optional[int]
+    parking: Optional[int]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    description: Optional[str]
+    image_one: Optional[str]
+    image_two: Optional[str]
+    image_three: Optional[str]
+    image_four: Optional[str]
+    image_five: Optional[str]
+
+# XML tag read for each Property field, in the same order
+PROPERTY_TAGS = (
+    'reference', 'url', 'propertyname', 'housename', 'propertytype',
+    'price', 'parish', 'status', 'type', 'bedrooms', 'bathrooms', 'receptions',
+    'parking', 'latitude', 'longitude', 'description', 'image_one', 'image_two',
+    'image_three', 'image_four', 'image_five',
+)
+
+# Tags coerced to numbers; everything else is kept as text
+TAGS_INT = frozenset({'bedrooms', 'bathrooms', 'receptions', 'parking'})
+TAGS_FLOAT = frozenset({'price', 'latitude', 'longitude'})
+
+# SQLite >= 3.24 UPSERT: one statement per property instead of SELECT then INSERT/UPDATE
+UPSERT_SQL = '''
+    INSERT INTO properties (
+        reference, url, property_name, house_name, property_type,
+        price, parish, status, type, bedrooms, bathrooms, receptions,
+        parking, latitude, longitude, description, image_one, image_two,
+        image_three, image_four, image_five
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(reference) DO UPDATE SET
+        url = excluded.url, property_name = excluded.property_name,
+        house_name = excluded.house_name, property_type = excluded.property_type,
+        price = excluded.price, parish = excluded.parish, status = excluded.status,
+        type = excluded.type, bedrooms = excluded.bedrooms,
+        bathrooms = excluded.bathrooms, receptions = excluded.receptions,
+        parking = excluded.parking, latitude = excluded.latitude,
+        longitude = excluded.longitude, description = excluded.description,
+        image_one = excluded.image_one, image_two = excluded.image_two,
+        image_three = excluded.image_three, image_four = excluded.image_four,
+        image_five = excluded.image_five,
+        last_updated = CURRENT_TIMESTAMP
+'''
+
 def fetch_xml_feed():
-    """Fetch the XML feed from ND Estates API"""
+    """Open a streaming response for the XML feed from ND Estates API"""
     try:
         print(f"📡 Fetching XML feed from: {XML_FEED_URL}")
-        response = requests.get(XML_FEED_URL, timeout=30)
+        response = requests.get(XML_FEED_URL, stream=True, timeout=30)
         response.raise_for_status()
-        print("✅ XML feed fetched successfully")
-        return response.content
+        # Let the parser read the decompressed body as it downloads
+        response.raw.decode_content = True
+        print("✅ XML feed connected")
+        return response
     except requests.RequestException as e:
         print(f"❌ Failed to fetch XML feed: {e}")
         return None
 
+def _coerce(tag, text):
+    """Convert feed text to the column type for its tag"""
+    if not text:
+        return None
+    try:
+        if tag in TAGS_INT:
+            return int(text)
+        if tag in TAGS_FLOAT:
+            return float(text)
+    except ValueError:
+        return None
+    return text
+
 def parse_property_element(property_elem):
     """Parse a single property element from XML"""
 
-    def get_text(elem, tag):
-        """Safely get text from XML element"""
-        child = elem.find(tag)
-        return child.text.strip() if child is not None and child.text else None
-
-    def get_float(elem, tag):
-        """Safely get float from XML element"""
-        text = get_text(elem, tag)
-        try:
-            return float(text) if text else None
-        except ValueError:
-            return None
-
-    def get_int(elem, tag):
-        """Safely get int from XML element"""
-        text = get_text(elem, tag)
-        try:
-            return int(text) if text else None
-        except ValueError:
-            return None
-
     try:
-        property_data = {
-            'reference': get_text(property_elem, 'reference'),
-            'url': get_text(property_elem, 'url'),
-            'property_name': get_text(property_elem, 'propertyname'),
-            'house_name': get_text(property_elem, 'housename'),
-            'property_type': get_text(property_elem, 'propertytype'),
-            'price': get_float(property_elem, 'price'),
-            'parish': get_text(property_elem, 'parish'),
-            'status': get_text(property_elem, 'status'),
-            'type': get_text(property_elem, 'type'),  # buy/rent
-            'bedrooms': get_int(property_elem, 'bedrooms'),
-            'bathrooms': get_int(property_elem, 'bathrooms'),
-            'receptions': get_int(property_elem, 'receptions'),
-            'parking': get_int(property_elem, 'parking'),
-            'latitude': get_float(property_elem, 'latitude'),
-            'longitude': get_float(property_elem, 'longitude'),
-            'description': get_text(property_elem, 'description'),
-            'image_one': get_text(property_elem, 'image_one'),
-            'image_two': get_text(property_elem, 'image_two'),
-            'image_three': get_text(property_elem, 'image_three'),
-            'image_four': get_text(property_elem, 'image_four'),
-            'image_five': get_text(property_elem, 'image_five'),
-        }
+        # Walk the children once instead of a find() scan per field
+        raw = {child.tag: (child.text or '').strip() for child in child_elements(property_elem)}
+        property_data = Property._make(_coerce(tag, raw.get(tag)) for tag in PROPERTY_TAGS)
 
         # Validate required fields
-        if not property_data['reference'] or not property_data['url']:
-            print(f"⚠️  Skipping property with missing reference or URL: {property_data.get('reference', 'Unknown')}")
+        if not property_data.reference or not property_data.url:
+            print(f"⚠️  Skipping property with missing reference or URL: {property_data.reference or 'Unknown'}")
             return None
 
         return property_data
@@ -89,79 +144,66 @@ def parse_property_element(property_elem):
         print(f"❌ Error parsing property element: {e}")
         return None
 
-def import_properties_to_db(xml_content):
-    """Import properties from XML content to database"""
+def import_properties_to_db(xml_source):
+    """Import properties from an XML file-like object (or bytes) to database"""
 
     if not os.path.exists(DB_PATH):
         print("❌ Database does not exist. Run create_property_database.py first.")
         return 0
 
+    if sqlite3.sqlite_version_info < (3, 24, 0):
+        print(f"❌ SQLite {sqlite3.sqlite_version} is too old for UPSERT (3.24+ required)")
+        return 0
+
     try:
-        # Parse XML
-        root = ET.fromstring(xml_content)
-
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        imported_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        for property_elem in root.findall('property'):
-            property_data = parse_property_element(property_elem)
-
-            if not property_data:
-                skipped_count += 1
-                continue
-
-            # Check if property already exists
-            cursor.execute('SELECT id FROM properties WHERE reference = ?', (property_data['reference'],))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing property
-                cursor.execute('''
-                    UPDATE properties SET
-                        url = ?, property_name = ?, house_name = ?, property_type = ?,
-                        price = ?, parish = ?, status = ?, type = ?, bedrooms = ?,
-                        bathrooms = ?, receptions = ?, parking = ?, latitude = ?,
-                        longitude = ?, description = ?, image_one = ?, image_two = ?,
-                        image_three = ?, image_four = ?, image_five = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE reference = ?
-                ''', (
-                    property_data['url'], property_data['property_name'], property_data['house_name'],
-                    property_data['property_type'], property_data['price'], property_data['parish'],
-                    property_data['status'], property_data['type'], property_data['bedrooms'],
-                    property_data['bathrooms'], property_data['receptions'], property_data['parking'],
-                    property_data['latitude'], property_data['longitude'], property_data['description'],
-                    property_data['image_one'], property_data['image_two'], property_data['image_three'],
-                    property_data['image_four'], property_data['image_five'],
-                    property_data['reference']
-                ))
-                updated_count += 1
-            else:
-                # Insert new property
-                cursor.execute('''
-                    INSERT INTO properties (
-                        reference, url, property_name, house_name, property_type,
-                        price, parish, status, type, bedrooms, bathrooms, receptions,
-                        parking, latitude, longitude, description, image_one, image_two,
-                        image_three, image_four, image_five
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    property_data['reference'], property_data['url'], property_data['property_name'],
-                    property_data['house_name'], property_data['property_type'], property_data['price'],
-                    property_data['parish'], property_data['status'], property_data['type'],
-                    property_data['bedrooms'], property_data['bathrooms'], property_data['receptions'],
-                    property_data['parking'], property_data['latitude'], property_data['longitude'],
-                    property_data['description'], property_data['image_one'], property_data['image_two'],
-                    property_data['image_three'], property_data['image_four'], property_data['image_five']
-                ))
-                imported_count += 1
-
-        conn.commit()
-        conn.close()
+        if isinstance(xml_source, bytes):
+            xml_source = io.BytesIO(xml_source)
+
+        # Autocommit mode so the whole import runs in one explicit transaction; the
+        # connection is closed however the parse or the writes end
+        with closing(sqlite3.connect(DB_PATH, isolation_level=None)) as conn:
+            cursor = conn.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA cache_size=-65536')
+
+            # Known references let us report new vs updated without a per-row SELECT
+            cursor.execute('SELECT reference FROM properties')
+            existing_references = {row[0] for row in cursor.fetchall()}
+
+            imported_count = 0
+            updated_count = 0
+            skipped_count = 0
+            rows = []
+
+            # Parse incrementally so each property is handled as soon as it arrives
+            for _, property_elem in ET.iterparse(xml_source, **ITERPARSE_OPTIONS):
+                if property_elem.tag != 'property':
+                    continue
+
+                property_data = parse_property_element(property_elem)
+                release_element(property_elem)
+
+                if not property_data:
+                    skipped_count += 1
+                    continue
+
+                if property_data.reference in existing_references:
+                    updated_count += 1
+                else:
+                    existing_references.add(property_data.reference)
+                    imported_count += 1
+
+                rows.append(property_data)
+
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                cursor.executemany(UPSERT_SQL, rows)
+                cursor.execute('COMMIT')
+            except sqlite3.Error:
+                cursor.execute('ROLLBACK')
+                raise
 
         print(f"✅ Import completed:")
         print(f"   📥 New properties imported: {imported_count}")
@@ -194,12 +236,13 @@ def main():
     print("=" * 50)
 
     # Fetch XML feed
-    xml_content = fetch_xml_feed()
-    if not xml_content:
+    response = fetch_xml_feed()
+    if response is None:
         return
 
-    # Import to database
-    imported_count = import_properties_to_db(xml_content)
+    # Import to database while the feed streams in
+    with response:
+        imported_count = import_properties_to_db(response.raw)
 
     if imported_count > 0:
         # Update campaigns
@@ -7,12 +7,48 @@ and populates the MariaDB google-stats database with campaign assignments.
 """
 
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
 import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
+import functools
 import hashlib
+import io
+import os
+import queue
+import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from lxml import etree as ET
+    # Skip ID indexing, allow very large feeds and only report <property> elements
+    ITERPARSE_OPTIONS = {'tag': 'property', 'huge_tree': True, 'collect_ids': False, 'remove_blank_text': True}
+    # All element children in one C call, leaving out comments and processing instructions
+    child_elements = ET.XPath('./*')
+
+    def release_element(elem):
+        """Clear a parsed element and drop the finished siblings still attached to the root"""
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+except ImportError:
+    import xml.etree.ElementTree as ET
+    ITERPARSE_OPTIONS = {}
+    child_elements = list
+
+    def release_element(elem):
+        """Clear a parsed element (ElementTree has no parent links to prune)"""
+        elem.clear()
+
+try:
+    import zstandard
+    # Cached feeds are stored compressed; the XML shrinks roughly tenfold
+    ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+except ImportError:
+    ZSTD_COMPRESSOR = ZSTD_DECOMPRESSOR = None
 
 # MariaDB connection parameters
 MARIADB_CONFIG = {
@@ -27,55 +63,145 @@ MARIADB_CONFIG = {
 XML_FEED_URL = 'https://api.ndestates.com/feeds/ndefeed.xml'
 MIN_FETCH_INTERVAL_MINUTES = 30
 
+# Rows per executemany batch, and how many parsed rows may wait for the writer
+BATCH_SIZE = 500
+QUEUE_MAXSIZE = 1000
+
+# Built once and sent through executemany, which folds each batch into a single
+# multi-row INSERT. A prepared cursor would instead execute once per row.
+UPSERT_SQL = '''
+    INSERT INTO properties
+    (reference, url, property_name, house_name, property_type, price, parish,
+     status, type, bedrooms, bathrooms, receptions, parking, latitude, longitude,
+     description, image_one, image_two, image_three, image_four, image_five, campaign)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+    url = VALUES(url), property_name = VALUES(property_name), house_name = VALUES(house_name),
+    property_type = VALUES(property_type), price = VALUES(price), status = VALUES(status),
+    bedrooms = VALUES(bedrooms), bathrooms = VALUES(bathrooms), receptions = VALUES(receptions),
+    parking = VALUES(parking), latitude = VALUES(latitude), longitude = VALUES(longitude),
+    description = VALUES(description), image_one = VALUES(image_one), image_two = VALUES(image_two),
+    image_three = VALUES(image_three), image_four = VALUES(image_four), image_five = VALUES(image_five),
+    campaign = VALUES(campaign), last_updated = CURRENT_TIMESTAMP
+'''
+
+# Bulk path for an empty properties table; REPLACE keeps the last row for repeated references
+LOAD_DATA_SQL = '''
+    LOAD DATA LOCAL INFILE %s
+    REPLACE INTO TABLE properties
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+    LINES TERMINATED BY '\\n'
+    (reference, url, property_name, house_name, property_type, price, parish,
+     status, type, bedrooms, bathrooms, receptions, parking, latitude, longitude,
+     description, image_one, image_two, image_three, image_four, image_five, campaign)
+'''
+
+# LOAD DATA's escape sequences for the spool file; None is written as \N
+SPOOL_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+SPOOL_UNESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', '0': '\0'}
+SPOOL_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+# Server or client refusing LOAD DATA LOCAL INFILE (e.g. local_infile=OFF on the server)
+LOCAL_INFILE_DISABLED_ERRORS = frozenset({
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+    errorcode.CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+    4166,  # MariaDB ER_LOAD_INFILE_CAPABILITY_DISABLED, not in mysql.connector's errorcode
+})
+
 def get_campaign_name(parish, property_type):
     """Determine campaign name based on parish and property type"""
-    property_category = 'Apartments' if property_type and 'apartment' in property_type.lower() else 'Properties'
+    return _campaign_name(parish, property_type or '')
+
+
+@functools.lru_cache(maxsize=512)
+def _campaign_name(parish, property_type):
+    """Cached campaign lookup; the feed only has a handful of parish/type pairs"""
+    property_category = 'Apartments' if 'apartment' in property_type.lower() else 'Properties'
     return f"{parish} {property_category}"
 
 
-def get_cached_feed(conn):
-    """Fetch the most recent cached feed entry"""
+def get_cached_feed_meta(conn):
+    """Fetch the most recent cached feed entry without its payload
+
+    Served by idx_feed_url_fetched (see create_mariadb_database.py), so this is
+    a single index descent rather than a filesort over the cache table.
+    """
     cursor = conn.cursor(dictionary=True)
     cursor.execute(
         """
-        SELECT id, etag, last_modified_header, payload, fetched_at
+        SELECT id, etag, last_modified_header, fetched_at, content_hash,
+               (payload IS NOT NULL OR (payload_zstd IS NOT NULL AND %s))
+                   AND content_length > 0 AS has_payload
         FROM feed_cache
         WHERE feed_url = %s
         ORDER BY fetched_at DESC
         LIMIT 1
         """,
-        (XML_FEED_URL,)
+        (ZSTD_DECOMPRESSOR is not None, XML_FEED_URL)
     )
     row = cursor.fetchone()
     cursor.close()
     return row
 
 
-def cache_feed_response(conn, status_code, payload, etag, last_modified_header):
-    """Persist feed response to cache"""
+def get_cached_payload(conn, cache_id):
+    """Fetch the payload bytes of a cached feed entry, decompressing them if needed"""
+    cursor = conn.cursor()
+    cursor.execute("SELECT payload, payload_zstd FROM feed_cache WHERE id = %s", (cache_id,))
+    row = cursor.fetchone()
+    cursor.close()
+    if not row:
+        return None
+    payload, payload_zstd = row
+    if payload is None and payload_zstd is not None and ZSTD_DECOMPRESSOR is not None:
+        return ZSTD_DECOMPRESSOR.decompress(bytes(payload_zstd))
+    # The plain-text column only ever holds UTF-8 text
+    return payload.encode('utf-8') if payload is not None else None
+
+
+def cache_feed_response(conn, status_code, content, etag, last_modified_header):
+    """Persist feed response (its body as received, in bytes) to cache and return its content hash"""
     cursor = conn.cursor()
-    content_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
-    content_length = len(payload.encode('utf-8'))
+    content_hash = hashlib.sha256(content).hexdigest()
+    content_length = len(content)
+    # Store either the compressed bytes or, without zstandard, the plain text
+    payload = payload_zstd = None
+    if ZSTD_COMPRESSOR is not None:
+        payload_zstd = ZSTD_COMPRESSOR.compress(content)
+    else:
+        try:
+            payload = content.decode('utf-8')
+        except UnicodeDecodeError:
+            pass  # Feeds in other encodings are only cached compressed
     cursor.execute(
         """
-        INSERT INTO feed_cache (feed_url, etag, last_modified_header, payload, content_hash, content_length, status_code)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO feed_cache (feed_url, etag, last_modified_header, payload, payload_zstd,
+                                content_hash, content_length, status_code)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
         """,
-        (XML_FEED_URL, etag, last_modified_header, payload, content_hash, content_length, status_code)
+        (XML_FEED_URL, etag, last_modified_header, payload, payload_zstd,
+         content_hash, content_length, status_code)
     )
     conn.commit()
     cursor.close()
+    return content_hash
 
 
 def fetch_feed_with_cache(conn, force_refresh=False):
-    """Fetch feed using cache and conditional requests to avoid unnecessary API calls"""
-    cached = get_cached_feed(conn)
+    """Fetch feed using cache and conditional requests to avoid unnecessary API calls
+
+    Returns the payload bytes, where they came from and their SHA-256 content hash.
+    """
+    # Decide on metadata alone so a stale entry's payload is never transferred
+    cached = get_cached_feed_meta(conn)
 
     # Use cached payload if fetched recently and not forcing refresh
     if not force_refresh and cached and cached.get('fetched_at'):
         fetched_at = cached['fetched_at']
-        if cached.get('payload') and fetched_at >= datetime.now() - timedelta(minutes=MIN_FETCH_INTERVAL_MINUTES):
-            return cached['payload'], 'cache-recent'
+        if cached.get('has_payload') and fetched_at >= datetime.now() - timedelta(minutes=MIN_FETCH_INTERVAL_MINUTES):
+            return get_cached_payload(conn, cached['id']), 'cache-recent', cached['content_hash']
 
     headers = {}
     if not force_refresh and cached and cached.get('etag'):
@@ -87,17 +213,223 @@ def fetch_feed_with_cache(conn, force_refresh=False):
 
     if not force_refresh and response.status_code == 304:
         # Not modified; use cached payload
-        if not cached or not cached.get('payload'):
+        if not cached or not cached.get('has_payload'):
             raise ValueError("Received 304 but no cached payload available")
-        return cached['payload'], 'cache-304'
+        return get_cached_payload(conn, cached['id']), 'cache-304', cached['content_hash']
 
     response.raise_for_status()
-    payload = response.text
+    # The raw body, so the parser decodes it as the document's XML declaration says
+    payload = response.content
     etag = response.headers.get('ETag')
     last_modified_header = response.headers.get('Last-Modified')
 
-    cache_feed_response(conn, response.status_code, payload, etag, last_modified_header)
-    return payload, 'network'
+    content_hash = cache_feed_response(conn, response.status_code, payload, etag, last_modified_header)
+    return payload, 'network', content_hash
+
+def get_last_import_hash(conn):
+    """Return the content hash of the last successfully imported payload"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT last_content_hash FROM feed_import_state WHERE feed_url = %s",
+        (XML_FEED_URL,)
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    return row[0] if row else None
+
+
+def record_import_hash(conn, content_hash):
+    """Remember the payload hash once its properties have been imported"""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        INSERT INTO feed_import_state (feed_url, last_content_hash, last_imported_at)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+        last_content_hash = VALUES(last_content_hash), last_imported_at = VALUES(last_imported_at)
+        """,
+        (XML_FEED_URL, content_hash, datetime.now())
+    )
+    cursor.close()
+
+
+def _int(raw, tag, default=0):
+    """Integer value of a feed tag, or default when missing or malformed"""
+    text = raw.get(tag)
+    if not text:
+        return default
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+
+def _float(raw, tag, default=0):
+    """Float value of a feed tag, or default when missing or malformed"""
+    text = raw.get(tag)
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _text(raw, tag, default=''):
+    """Text of a feed tag: default when the tag is missing, None when it is empty"""
+    if tag not in raw:
+        return default
+    return raw[tag] or None
+
+
+def parse_property_row(prop_elem):
+    """Build the properties row tuple for a single <property> element"""
+    # Extract data in a single pass over the children
+    raw = {child.tag: (child.text or '').strip() for child in child_elements(prop_elem)}
+
+    property_type = _text(raw, 'propertytype')
+    parish = _text(raw, 'parish', 'Jersey')
+
+    return (
+        _text(raw, 'reference'),
+        _text(raw, 'url'),
+        _text(raw, 'propertyname'),
+        _text(raw, 'houseName'),
+        property_type,
+        _float(raw, 'price'),
+        parish,
+        _text(raw, 'status', 'Available'),
+        _text(raw, 'type', 'buy'),
+        _int(raw, 'bedrooms'),
+        _int(raw, 'bathrooms'),
+        _int(raw, 'receptions'),
+        _int(raw, 'parking'),
+        _float(raw, 'latitude'),
+        _float(raw, 'longitude'),
+        _text(raw, 'description'),
+        _text(raw, 'image_one'),
+        _text(raw, 'image_two'),
+        _text(raw, 'image_three'),
+        _text(raw, 'image_four'),
+        _text(raw, 'image_five'),
+        get_campaign_name(parish, property_type),
+    )
+
+
+def produce_property_rows(payload, row_queue, stop_event):
+    """Stream-parse the feed bytes and queue a row per property, ending with a None sentinel"""
+    properties_found = 0
+    properties_skipped = 0
+    try:
+        # The root element is <xml>, and properties are direct children
+        for _, elem in ET.iterparse(io.BytesIO(payload), **ITERPARSE_OPTIONS):
+            if elem.tag != 'property':
+                continue
+            if stop_event.is_set():
+                break
+            properties_found += 1
+            try:
+                row = parse_property_row(elem)
+            except Exception as e:
+                properties_skipped += 1
+                print(f"⚠️  Skipping property due to error: {e}")
+            else:
+                row_queue.put(row)
+            release_element(elem)
+    except Exception:
+        # Flag the failure before the sentinel so the writer discards the partial feed
+        stop_event.set()
+        raise
+    finally:
+        row_queue.put(None)
+    return properties_found, properties_skipped
+
+
+def spool_line(row):
+    """A row as one line of the LOAD DATA spool file"""
+    return '\t'.join(
+        '\\N' if value is None else str(value).translate(SPOOL_ESCAPES) for value in row
+    ) + '\n'
+
+
+def _unescape_spool(match):
+    return SPOOL_UNESCAPES.get(match[1], match[1])
+
+
+def read_spool_rows(spool_path):
+    """Yield the rows of a spool file, with values as text and None for \\N"""
+    with open(spool_path, encoding='utf-8', newline='') as spool:
+        for line in spool:
+            yield [
+                None if field == '\\N' else SPOOL_ESCAPE_RE.sub(_unescape_spool, field)
+                for field in line[:-1].split('\t')
+            ]
+
+
+def upsert_spooled_rows(cursor, spool_path):
+    """Send the rows of a bulk-load spool file through the batched upsert instead"""
+    # Values come back as text, which MariaDB converts just as LOAD DATA would
+    batch = []
+    for row in read_spool_rows(spool_path):
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            cursor.executemany(UPSERT_SQL, batch)
+            batch = []
+    if batch:
+        cursor.executemany(UPSERT_SQL, batch)
+
+
+def write_property_rows(cursor, row_queue, stop_event, existing_references, bulk_load=False):
+    """Drain queued rows into batched upserts (or one bulk load) until the sentinel arrives"""
+    properties_imported = 0
+    properties_updated = 0
+    batch = []
+    sentinel_received = False
+    spool = None
+    if bulk_load:
+        spool = tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', suffix='.tsv', delete=False)
+    try:
+        while True:
+            row = row_queue.get()
+            sentinel_received = row is None
+            if sentinel_received and stop_event.is_set():
+                # The parser failed partway: write nothing, the transaction is never committed
+                return properties_imported, properties_updated
+            if row is not None:
+                # Count new vs updated here so upserts never wait on rowcount
+                if row[0] in existing_references:
+                    properties_updated += 1
+                else:
+                    existing_references.add(row[0])
+                    properties_imported += 1
+                batch.append(row)
+            if batch and (row is None or len(batch) >= BATCH_SIZE):
+                if spool:
+                    spool.writelines(map(spool_line, batch))
+                else:
+                    cursor.executemany(UPSERT_SQL, batch)
+                batch = []
+            if row is None:
+                if spool:
+                    spool.close()
+                    try:
+                        cursor.execute(LOAD_DATA_SQL, (spool.name,))
+                    except Error as e:
+                        if e.errno not in LOCAL_INFILE_DISABLED_ERRORS:
+                            raise
+                        print(f"⚠️  LOAD DATA LOCAL INFILE is not allowed ({e.msg}); using batched upserts instead.")
+                        upsert_spooled_rows(cursor, spool.name)
+                return properties_imported, properties_updated
+    finally:
+        if not sentinel_received:
+            # Unblock the parser so it can reach its sentinel and exit
+            stop_event.set()
+            while row_queue.get() is not None:
+                pass
+        if spool:
+            spool.close()
+            os.unlink(spool.name)
+
 
 def import_property_feed():
     """Import properties from XML feed into MariaDB"""
@@ -107,7 +439,10 @@ def import_property_feed():
     
     try:
         # Connect to MariaDB first (needed for cache)
-        conn = mysql.connector.connect(**MARIADB_CONFIG)
+        # LOCAL INFILE is only allowed for the spool files written to the temp dir
+        conn = mysql.connector.connect(**MARIADB_CONFIG, allow_local_infile_in_path=tempfile.gettempdir())
+        # All property writes land in one transaction, committed after the last batch
+        conn.autocommit = False
         cursor = conn.cursor()
 
         # Check if properties table is empty
@@ -120,87 +455,34 @@ def import_property_feed():
 
         # Fetch XML feed with cache support
         print(f"📡 Fetching XML feed from: {XML_FEED_URL}")
-        payload, source = fetch_feed_with_cache(conn, force_refresh=force_refresh)
+        payload, source, content_hash = fetch_feed_with_cache(conn, force_refresh=force_refresh)
         print(f"✅ Feed ready via: {source}")
 
-        # Parse XML
-        root = ET.fromstring(payload)
-
-        # The root element is <xml>, and properties are direct children
-        properties_found = root.findall('property')
-        print(f"🔍 Found {len(properties_found)} properties in the XML feed.")
+        # Skip parsing and upserts entirely when the feed matches the last import
+        if not force_refresh and get_last_import_hash(conn) == content_hash:
+            print("ℹ️ Feed unchanged since the last import. Nothing to do.")
+            return
 
-        properties_imported = 0
-        properties_updated = 0
-        properties_skipped = 0
-
-        # Process each property
-        for prop_elem in properties_found:
-            try:
-                # Extract data
-                reference = prop_elem.find('reference').text if prop_elem.find('reference') is not None else ''
-                url = prop_elem.find('url').text if prop_elem.find('url') is not None else ''
-                property_name = prop_elem.find('propertyname').text if prop_elem.find('propertyname') is not None else ''
-                house_name = prop_elem.find('houseName').text if prop_elem.find('houseName') is not None else ''
-                property_type = prop_elem.find('propertytype').text if prop_elem.find('propertytype') is not None else ''
-                
-                price_elem = prop_elem.find('price')
-                price = float(price_elem.text) if price_elem is not None and price_elem.text else 0
-                
-                parish = prop_elem.find('parish').text if prop_elem.find('parish') is not None else 'Jersey'
-                status = prop_elem.find('status').text if prop_elem.find('status') is not None else 'Available'
-                type_sale = prop_elem.find('type').text if prop_elem.find('type') is not None else 'buy'
-                
-                bedrooms = int(prop_elem.find('bedrooms').text or 0) if prop_elem.find('bedrooms') is not None else 0
-                bathrooms = int(prop_elem.find('bathrooms').text or 0) if prop_elem.find('bathrooms') is not None else 0
-                receptions = int(prop_elem.find('receptions').text or 0) if prop_elem.find('receptions') is not None else 0
-                parking = int(prop_elem.find('parking').text or 0) if prop_elem.find('parking') is not None else 0
-                
-                latitude = float(prop_elem.find('latitude').text or 0) if prop_elem.find('latitude') is not None else 0
-                longitude = float(prop_elem.find('longitude').text or 0) if prop_elem.find('longitude') is not None else 0
-                
-                description = prop_elem.find('description').text if prop_elem.find('description') is not None else ''
-                
-                image_one = prop_elem.find('image_one').text if prop_elem.find('image_one') is not None else ''
-                image_two = prop_elem.find('image_two').text if prop_elem.find('image_two') is not None else ''
-                image_three = prop_elem.find('image_three').text if prop_elem.find('image_three') is not None else ''
-                image_four = prop_elem.find('image_four').text if prop_elem.find('image_four') is not None else ''
-                image_five = prop_elem.find('image_five').text if prop_elem.find('image_five') is not None else ''
-                
-                campaign = get_campaign_name(parish, property_type)
-
-                # Insert or update property
-                cursor.execute('''
-                    INSERT INTO properties 
-                    (reference, url, property_name, house_name, property_type, price, parish, 
-                     status, type, bedrooms, bathrooms, receptions, parking, latitude, longitude, 
-                     description, image_one, image_two, image_three, image_four, image_five, campaign)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                    url = VALUES(url), property_name = VALUES(property_name), house_name = VALUES(house_name),
-                    property_type = VALUES(property_type), price = VALUES(price), status = VALUES(status),
-                    bedrooms = VALUES(bedrooms), bathrooms = VALUES(bathrooms), receptions = VALUES(receptions),
-                    parking = VALUES(parking), latitude = VALUES(latitude), longitude = VALUES(longitude),
-                    description = VALUES(description), image_one = VALUES(image_one), image_two = VALUES(image_two),
-                    image_three = VALUES(image_three), image_four = VALUES(image_four), image_five = VALUES(image_five),
-                    campaign = VALUES(campaign), last_updated = CURRENT_TIMESTAMP
-                ''', (reference, url, property_name, house_name, property_type, price, parish,
-                      status, type_sale, bedrooms, bathrooms, receptions, parking, latitude, longitude,
-                      description, image_one, image_two, image_three, image_four, image_five, campaign))
-                
-                if cursor.rowcount == 1:
-                    properties_imported += 1
-                elif cursor.rowcount == 2:
-                    properties_updated += 1
-                else:
-                    # This can happen if the data is identical and no update occurs
-                    pass
-
-            except Exception as e:
-                properties_skipped += 1
-                print(f"⚠️  Skipping property due to error: {e}")
-                continue
+        cursor.execute('SELECT reference FROM properties')
+        existing_references = {row[0] for row in cursor.fetchall()}
 
+        if force_refresh:
+            print("ℹ️ Bulk loading properties with LOAD DATA LOCAL INFILE.")
+
+        # Parse and write on separate threads so parsing overlaps MariaDB round trips
+        row_queue = queue.Queue(maxsize=QUEUE_MAXSIZE)
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            producer = executor.submit(produce_property_rows, payload, row_queue, stop_event)
+            consumer = executor.submit(
+                write_property_rows, cursor, row_queue, stop_event, existing_references, bulk_load=force_refresh
+            )
+            properties_found, properties_skipped = producer.result()
+            properties_imported, properties_updated = consumer.result()
+
+        print(f"🔍 Found {properties_found} properties in the XML feed.")
+
+        record_import_hash(conn, content_hash)
         conn.commit()
 
         print(f"\n✅ Import completed:")
@@ -215,7 +497,12 @@ def import_property_feed():
         print(f"\n🔍 MariaDB now contains {total} properties")
 
     except Error as e:
-        print(f"❌ MariaDB Error: {e}")
+        if e.errno in (errorcode.ER_NO_SUCH_TABLE, errorcode.ER_BAD_FIELD_ERROR):
+            # Tables and columns are created by the schema script, never by the import itself
+            print(f"❌ MariaDB schema is out of date: {e.msg}")
+            print("   Run scripts/create_mariadb_database.py to create the missing tables and columns.")
+        else:
+            print(f"❌ MariaDB Error: {e}")
         sys.exit(1)
     except requests.exceptions.RequestException as e:
         print(f"❌ Failed to fetch XML feed: {e}")
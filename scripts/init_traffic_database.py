@@ -7,7 +7,8 @@ DDEV Usage:
     ddev exec python3 scripts/init_traffic_database.py
 
 Creates:
-    - property_traffic_detail: Stores source + medium + metrics per property per date range
+    - traffic_source / traffic_medium: Lookup tables for GA4 source and medium names
+    - property_traffic_detail: Stores source + medium ids + metrics per property per date range
 """
 
 import os
@@ -18,6 +19,9 @@ from mysql.connector import Error
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Lookup tables holding the distinct GA4 source and medium names
+LOOKUP_TABLES = ('traffic_source', 'traffic_medium')
+
 
 def get_db_connection():
     """Get database connection."""
@@ -34,8 +38,84 @@ def get_db_connection():
         return None
 
 
+def column_exists(cursor, table, column):
+    """Check whether a column exists in the current database."""
+    cursor.execute("""
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+    """, (table, column))
+    return cursor.fetchone()[0] > 0
+
+
+def migrate_source_medium_columns(cursor):
+    """Move inline traffic_source/traffic_medium strings into the lookup tables."""
+    if not column_exists(cursor, 'property_traffic_detail', 'traffic_source'):
+        return
+
+    print("🔄 Migrating traffic_source/traffic_medium to lookup tables...")
+    cursor.execute("INSERT IGNORE INTO traffic_source (name) SELECT DISTINCT traffic_source FROM property_traffic_detail")
+    cursor.execute("INSERT IGNORE INTO traffic_medium (name) SELECT DISTINCT traffic_medium FROM property_traffic_detail")
+    cursor.execute("""
+        ALTER TABLE property_traffic_detail
+            ADD COLUMN source_id SMALLINT UNSIGNED NULL AFTER period_days,
+            ADD COLUMN medium_id SMALLINT UNSIGNED NULL AFTER source_id
+    """)
+    cursor.execute("""
+        UPDATE property_traffic_detail ptd
+        JOIN traffic_source ts ON ts.name = ptd.traffic_source
+        JOIN traffic_medium tm ON tm.name = ptd.traffic_medium
+        SET ptd.source_id = ts.id, ptd.medium_id = tm.id
+    """)
+    cursor.execute("""
+        ALTER TABLE property_traffic_detail
+            DROP INDEX unique_traffic_record,
+            DROP INDEX idx_source,
+            DROP INDEX idx_medium,
+            DROP COLUMN traffic_source,
+            DROP COLUMN traffic_medium,
+            MODIFY source_id SMALLINT UNSIGNED NOT NULL,
+            MODIFY medium_id SMALLINT UNSIGNED NOT NULL,
+            ADD UNIQUE KEY unique_traffic_record (reference, report_date, period_days, source_id, medium_id),
+            ADD INDEX idx_source_date (source_id, report_date),
+            ADD INDEX idx_medium_date (medium_id, report_date),
+            ADD CONSTRAINT fk_traffic_source FOREIGN KEY (source_id) REFERENCES traffic_source(id),
+            ADD CONSTRAINT fk_traffic_medium FOREIGN KEY (medium_id) REFERENCES traffic_medium(id)
+    """)
+    print("✅ Migrated existing rows to source_id/medium_id")
+
+
+def drop_redundant_indexes(cursor):
+    """Drop idx_reference, a leftmost prefix of the unique key, and idx_report_date, which no query filters on alone."""
+    cursor.execute("""
+        ALTER TABLE property_traffic_detail
+            DROP INDEX IF EXISTS idx_reference,
+            DROP INDEX IF EXISTS idx_report_date
+    """)
+
+
+def narrow_metric_columns(cursor):
+    """Shrink metric columns created as INT/DECIMAL to MEDIUMINT UNSIGNED/FLOAT."""
+    cursor.execute("""
+        SELECT DATA_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'property_traffic_detail' AND COLUMN_NAME = 'sessions'
+    """)
+    row = cursor.fetchone()
+    if not row or row[0] != 'int':
+        return
+
+    print("🔄 Narrowing property_traffic_detail metric columns...")
+    cursor.execute("""
+        ALTER TABLE property_traffic_detail
+            MODIFY COLUMN sessions MEDIUMINT UNSIGNED DEFAULT 0,
+            MODIFY COLUMN pageviews MEDIUMINT UNSIGNED DEFAULT 0,
+            MODIFY COLUMN users MEDIUMINT UNSIGNED DEFAULT 0,
+            MODIFY COLUMN avg_session_duration FLOAT DEFAULT 0,
+            MODIFY COLUMN bounce_rate FLOAT DEFAULT 0
+    """)
+
+
 def init_traffic_tables():
-    """Create property traffic detail table."""
+    """Create property traffic detail and source/medium lookup tables."""
     connection = get_db_connection()
     if not connection:
         return False
@@ -43,6 +123,16 @@ def init_traffic_tables():
     try:
         cursor = connection.cursor()
         
+        # Source/medium names live in small lookup tables referenced by id
+        print("📋 Creating traffic_source and traffic_medium lookup tables...")
+        for table in LOOKUP_TABLES:
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL UNIQUE
+                )
+            """)
+
         # Drop old tables if requested (careful!)
         print("📋 Creating property_traffic_detail table...")
         
@@ -54,24 +144,28 @@ def init_traffic_tables():
                 property_url TEXT,
                 report_date DATE NOT NULL,
                 period_days INT NOT NULL,
-                traffic_source VARCHAR(100) NOT NULL,
-                traffic_medium VARCHAR(100) NOT NULL,
-                sessions INT DEFAULT 0,
-                pageviews INT DEFAULT 0,
-                users INT DEFAULT 0,
-                avg_session_duration DECIMAL(10,2) DEFAULT 0,
-                bounce_rate DECIMAL(5,4) DEFAULT 0,
+                source_id SMALLINT UNSIGNED NOT NULL,
+                medium_id SMALLINT UNSIGNED NOT NULL,
+                sessions MEDIUMINT UNSIGNED DEFAULT 0,
+                pageviews MEDIUMINT UNSIGNED DEFAULT 0,
+                users MEDIUMINT UNSIGNED DEFAULT 0,
+                avg_session_duration FLOAT DEFAULT 0,
+                bounce_rate FLOAT DEFAULT 0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                UNIQUE KEY unique_traffic_record (reference, report_date, period_days, traffic_source, traffic_medium),
-                INDEX idx_reference (reference),
-                INDEX idx_report_date (report_date),
+                UNIQUE KEY unique_traffic_record (reference, report_date, period_days, source_id, medium_id),
                 INDEX idx_period (period_days),
-                INDEX idx_source (traffic_source),
-                INDEX idx_medium (traffic_medium),
-                INDEX idx_sessions (sessions DESC)
+                INDEX idx_source_date (source_id, report_date),
+                INDEX idx_medium_date (medium_id, report_date),
+                INDEX idx_sessions (sessions DESC),
+                CONSTRAINT fk_traffic_source FOREIGN KEY (source_id) REFERENCES traffic_source(id),
+                CONSTRAINT fk_traffic_medium FOREIGN KEY (medium_id) REFERENCES traffic_medium(id)
             )
         """)
+
+        migrate_source_medium_columns(cursor)
+        drop_redundant_indexes(cursor)
+        narrow_metric_columns(cursor)
         
         connection.commit()
         cursor.close()
@@ -83,8 +177,8 @@ def init_traffic_tables():
         print("   - property_url: Full property URL")
         print("   - report_date: Date of report generation")
         print("   - period_days: Time period analyzed (7, 30, 90, etc.)")
-        print("   - traffic_source: GA4 source (e.g., 'google', 'facebook.com', 'mailchimp')")
-        print("   - traffic_medium: GA4 medium (e.g., 'organic', 'cpc', 'email', 'social')")
+        print("   - source_id: traffic_source.id for the GA4 source (e.g., 'google', 'facebook.com', 'mailchimp')")
+        print("   - medium_id: traffic_medium.id for the GA4 medium (e.g., 'organic', 'cpc', 'email', 'social')")
         print("   - sessions: Number of sessions from this source/medium")
         print("   - pageviews: Number of pageviews")
         print("   - users: Number of unique users")
@@ -8,50 +8,150 @@ DDEV Usage:
 Features:
     - List all campaigns and ad groups
     - View all ads in a specific ad group
+    - View all ads in a campaign, fetching its ad groups concurrently
     - Duplicate existing ads
     - Create new responsive search ads
     - Interactive menu-driven interface
 """
 
+import asyncio
 import os
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 import json
 
+try:
+    import orjson
+    # Native encoder; writes the same UTF-8 JSON as json.dump with ensure_ascii=False
+    ORJSON_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
 # Add the parent directory to sys.path to import src modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.config import REPORTS_DIR, get_google_ads_client, GOOGLE_ADS_CUSTOMER_ID, GOOGLE_ADS_JSON_KEY_PATH
+from src.config import REPORTS_DIR, get_google_ads_client, enable_google_ads_keepalive, GOOGLE_ADS_CUSTOMER_ID, GOOGLE_ADS_JSON_KEY_PATH
+
+# Ad summaries listed per (customer_id, ad_group_id), and single ads fetched per
+# (customer_id, ad_group_id, ad_id), reused by menu options within the TTL
+ADS_CACHE_TTL_SECONDS = 60
+_ads_cache = {}
+_ad_cache = {}
+
+# Responsive search ad limits enforced by the Google Ads API
+MIN_HEADLINES, MAX_HEADLINES, MAX_HEADLINE_LENGTH = 3, 15, 30
+MIN_DESCRIPTIONS, MAX_DESCRIPTIONS, MAX_DESCRIPTION_LENGTH = 2, 4, 90
+
+# Ad groups queried at once when listing a whole campaign, keeping within per-customer rate limits
+MAX_CONCURRENT_AD_GROUP_QUERIES = 8
+
+# Enum value names per enum type, filled by enum_names()
+_enum_names = {}
+
+# GAQL queries; the ID placeholders are filled with validated integers
+CAMPAIGNS_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign.status,
+        campaign.advertising_channel_type
+    FROM campaign
+    WHERE campaign.status = 'ENABLED'
+    ORDER BY campaign.name
+"""
+AD_GROUPS_QUERY = """
+    SELECT
+        ad_group.id,
+        ad_group.name,
+        ad_group.status,
+        campaign.id,
+        campaign.name
+    FROM ad_group
+    WHERE campaign.id = {campaign_id}
+    AND ad_group.status = 'ENABLED'
+    ORDER BY ad_group.name
+"""
+# Enough for the ad listing table; the detail fields add the ad text and URLs
+AD_SUMMARY_FIELDS = """
+        ad_group_ad.ad.id,
+        ad_group_ad.ad.name,
+        ad_group_ad.status,
+        ad_group_ad.ad.type,
+        ad_group_ad.policy_summary.approval_status"""
+AD_DETAIL_FIELDS = """
+        ad_group_ad.ad.id,
+        ad_group_ad.ad.name,
+        ad_group_ad.status,
+        ad_group_ad.ad.type,
+        ad_group_ad.ad.responsive_search_ad.headlines,
+        ad_group_ad.ad.responsive_search_ad.descriptions,
+        ad_group_ad.ad.final_urls,
+        ad_group_ad.ad.final_mobile_urls,
+        ad_group_ad.policy_summary.approval_status,
+        ad_group.id,
+        ad_group.name,
+        campaign.id,
+        campaign.name"""
+ADS_IN_AD_GROUP_QUERY = f"""
+    SELECT{AD_DETAIL_FIELDS}
+    FROM ad_group_ad
+    WHERE ad_group.id = {{ad_group_id}}
+    ORDER BY ad_group_ad.ad.id
+"""
+ADS_SUMMARY_QUERY = f"""
+    SELECT{AD_SUMMARY_FIELDS}
+    FROM ad_group_ad
+    WHERE ad_group.id = {{ad_group_id}}
+    ORDER BY ad_group_ad.ad.id
+"""
+AD_BY_ID_QUERY = f"""
+    SELECT{AD_DETAIL_FIELDS}
+    FROM ad_group_ad
+    WHERE ad_group.id = {{ad_group_id}}
+    AND ad_group_ad.ad.id = {{ad_id}}
+"""
+
+def enum_names(client, enum_type):
+    """{value: name} of a raw protobuf enum, e.g. enum_names(client, "AdTypeEnum")[ad.type_]
+
+    The library generates its raw messages with the same field names as proto-plus,
+    so Ad's type field is type_ with or without use_proto_plus.
+    """
+    # client.enums builds a new wrapper on every access, so each mapping is built only once
+    names = _enum_names.get(enum_type)
+    if names is None:
+        enum = getattr(client.enums, enum_type)
+        names = _enum_names[enum_type] = {value.number: value.name for value in enum.DESCRIPTOR.enum_types[0].values}
+    return names
+
+@lru_cache(maxsize=None)
+def get_service(client, name):
+    """client.get_service, made once per client so every request shares one stub and its gRPC channel"""
+    return client.get_service(name)
+
+def stream_rows(client, customer_id, query):
+    """Run a GAQL query and yield its rows
+
+    search_stream returns every row in one streamed response, so there are no
+    per-page round trips as with search.
+    """
+    googleads_service = get_service(client, "GoogleAdsService")
+    for batch in googleads_service.search_stream(customer_id=customer_id, query=query):
+        yield from batch.results
 
 def list_campaigns(client, customer_id):
     """List all active campaigns"""
     
-    googleads_service = client.get_service("GoogleAdsService")
-    
-    query = """
-        SELECT
-            campaign.id,
-            campaign.name,
-            campaign.status,
-            campaign.advertising_channel_type
-        FROM campaign
-        WHERE campaign.status = 'ENABLED'
-        ORDER BY campaign.name
-    """
-    
-    request = client.get_type("SearchGoogleAdsRequest")
-    request.customer_id = str(customer_id).replace("-", "")
-    request.query = query
-    
-    response = googleads_service.search(request=request)
-    
     campaigns = []
-    for row in response:
+    for row in stream_rows(client, str(customer_id).replace("-", ""), CAMPAIGNS_QUERY):
         campaigns.append({
             'id': row.campaign.id,
             'name': row.campaign.name,
-            'status': row.campaign.status.name,
-            'type': row.campaign.advertising_channel_type.name
+            'status': enum_names(client, "CampaignStatusEnum")[row.campaign.status],
+            'type': enum_names(client, "AdvertisingChannelTypeEnum")[row.campaign.advertising_channel_type]
         })
     
     return campaigns
@@ -59,110 +159,162 @@ def list_campaigns(client, customer_id):
 def list_ad_groups(client, customer_id, campaign_id):
     """List ad groups in a specific campaign"""
     
-    googleads_service = client.get_service("GoogleAdsService")
-    
     customer_id = str(customer_id).replace("-", "")
     
-    query = f"""
-        SELECT
-            ad_group.id,
-            ad_group.name,
-            ad_group.status,
-            campaign.id,
-            campaign.name
-        FROM ad_group
-        WHERE campaign.id = {campaign_id}
-        AND ad_group.status = 'ENABLED'
-        ORDER BY ad_group.name
-    """
-    
-    request = client.get_type("SearchGoogleAdsRequest")
-    request.customer_id = customer_id
-    request.query = query
-    
-    response = googleads_service.search(request=request)
+    # int() rejects anything but a numeric ID before it reaches the query text
+    query = AD_GROUPS_QUERY.format(campaign_id=int(campaign_id))
     
     ad_groups = []
-    for row in response:
+    for row in stream_rows(client, customer_id, query):
         ad_groups.append({
             'id': row.ad_group.id,
             'name': row.ad_group.name,
-            'status': row.ad_group.status.name,
+            'status': enum_names(client, "AdGroupStatusEnum")[row.ad_group.status],
             'campaign_id': row.campaign.id,
             'campaign_name': row.campaign.name
         })
     
     return ad_groups
 
+def ad_row_to_summary(client, row):
+    """Shape an ad_group_ad query row into the fields shown in ad listings"""
+    
+    ad = row.ad_group_ad.ad
+    return {
+        'id': ad.id,
+        'name': ad.name if ad.name else f"Ad {ad.id}",
+        'status': enum_names(client, "AdGroupAdStatusEnum")[row.ad_group_ad.status],
+        'type': enum_names(client, "AdTypeEnum")[ad.type_],
+        'approval_status': enum_names(client, "PolicyApprovalStatusEnum")[row.ad_group_ad.policy_summary.approval_status],
+    }
+
+def ad_row_to_dict(client, row):
+    """Shape an ad_group_ad query row into the ad dict used throughout this script"""
+    
+    ad = row.ad_group_ad.ad
+    ad_info = {
+        **ad_row_to_summary(client, row),
+        'ad_group_id': row.ad_group.id,
+        'ad_group_name': row.ad_group.name,
+        'campaign_id': row.campaign.id,
+        'campaign_name': row.campaign.name,
+        'headlines': [],
+        'descriptions': [],
+        'final_urls': list(ad.final_urls),
+        'final_mobile_urls': list(ad.final_mobile_urls) if ad.final_mobile_urls else []
+    }
+    
+    # Extract headlines and descriptions for responsive search ads
+    if ad_info['type'] == 'RESPONSIVE_SEARCH_AD':
+        pinned_field_names = enum_names(client, "ServedAssetFieldTypeEnum")
+        ad_info['headlines'] = [
+            {'text': headline.text, 'pinned_field': pinned_field_names[pinned] if (pinned := headline.pinned_field) else None}
+            for headline in ad.responsive_search_ad.headlines
+        ]
+        ad_info['descriptions'] = [
+            {'text': description.text, 'pinned_field': pinned_field_names[pinned] if (pinned := description.pinned_field) else None}
+            for description in ad.responsive_search_ad.descriptions
+        ]
+    
+    return ad_info
+
 def list_ads_in_ad_group(client, customer_id, ad_group_id):
     """List all ads in a specific ad group with detailed information"""
     
-    googleads_service = client.get_service("GoogleAdsService")
+    customer_id = str(customer_id).replace("-", "")
+    
+    query = ADS_IN_AD_GROUP_QUERY.format(ad_group_id=int(ad_group_id))
+    
+    return [ad_row_to_dict(client, row) for row in stream_rows(client, customer_id, query)]
+
+def list_ads_summary(client, customer_id, ad_group_id):
+    """List the ads of an ad group without their text and URLs, for listing tables"""
+    
+    customer_id = str(customer_id).replace("-", "")
+    
+    query = ADS_SUMMARY_QUERY.format(ad_group_id=int(ad_group_id))
+    
+    return [ad_row_to_summary(client, row) for row in stream_rows(client, customer_id, query)]
+
+def get_ad_by_id(client, customer_id, ad_group_id, ad_id):
+    """Fetch the details of a single ad, or None if the ad group has no such ad"""
     
     customer_id = str(customer_id).replace("-", "")
     
-    query = f"""
-        SELECT
-            ad_group_ad.ad.id,
-            ad_group_ad.ad.name,
-            ad_group_ad.status,
-            ad_group_ad.ad.type,
-            ad_group_ad.ad.responsive_search_ad.headlines,
-            ad_group_ad.ad.responsive_search_ad.descriptions,
-            ad_group_ad.ad.final_urls,
-            ad_group_ad.ad.final_mobile_urls,
-            ad_group_ad.policy_summary.approval_status,
-            ad_group.id,
-            ad_group.name,
-            campaign.id,
-            campaign.name
-        FROM ad_group_ad
-        WHERE ad_group.id = {ad_group_id}
-        ORDER BY ad_group_ad.ad.id
+    query = AD_BY_ID_QUERY.format(ad_group_id=int(ad_group_id), ad_id=int(ad_id))
+    
+    for row in stream_rows(client, customer_id, query):
+        return ad_row_to_dict(client, row)
+    return None
+
+async def alist_ads_in_ad_group(client, customer_id, ad_group_id, googleads_service=None):
+    """Async list_ads_in_ad_group; pass googleads_service to share one async service client"""
+    
+    if googleads_service is None:
+        async with client.get_service("GoogleAdsService", is_async=True) as googleads_service:
+            return await alist_ads_in_ad_group(client, customer_id, ad_group_id, googleads_service)
+    
+    customer_id = str(customer_id).replace("-", "")
+    
+    query = ADS_IN_AD_GROUP_QUERY.format(ad_group_id=int(ad_group_id))
+    
+    stream = await googleads_service.search_stream(customer_id=customer_id, query=query)
+    return [ad_row_to_dict(client, row) async for batch in stream for row in batch.results]
+
+async def alist_ads_many(client, customer_id, ad_group_ids, max_concurrency=MAX_CONCURRENT_AD_GROUP_QUERIES):
+    """List the ads of several ad groups concurrently; one list per ad group, in order
+    
+    At most max_concurrency queries are in flight at a time.
     """
     
-    request = client.get_type("SearchGoogleAdsRequest")
-    request.customer_id = customer_id
-    request.query = query
-    
-    response = googleads_service.search(request=request)
-    
-    ads = []
-    for row in response:
-        ad_info = {
-            'id': row.ad_group_ad.ad.id,
-            'name': row.ad_group_ad.ad.name if row.ad_group_ad.ad.name else f"Ad {row.ad_group_ad.ad.id}",
-            'status': row.ad_group_ad.status.name,
-            'type': row.ad_group_ad.ad.type_.name,
-            'approval_status': row.ad_group_ad.policy_summary.approval_status.name,
-            'ad_group_id': row.ad_group.id,
-            'ad_group_name': row.ad_group.name,
-            'campaign_id': row.campaign.id,
-            'campaign_name': row.campaign.name,
-            'headlines': [],
-            'descriptions': [],
-            'final_urls': list(row.ad_group_ad.ad.final_urls),
-            'final_mobile_urls': list(row.ad_group_ad.ad.final_mobile_urls) if row.ad_group_ad.ad.final_mobile_urls else []
-        }
-        
-        # Extract headlines for responsive search ads
-        if row.ad_group_ad.ad.type_.name == 'RESPONSIVE_SEARCH_AD':
-            for headline in row.ad_group_ad.ad.responsive_search_ad.headlines:
-                ad_info['headlines'].append({
-                    'text': headline.text,
-                    'pinned_field': headline.pinned_field.name if headline.pinned_field else None
-                })
-            
-            for description in row.ad_group_ad.ad.responsive_search_ad.descriptions:
-                ad_info['descriptions'].append({
-                    'text': description.text,
-                    'pinned_field': description.pinned_field.name if description.pinned_field else None
-                })
+    slots = asyncio.Semaphore(max_concurrency)
+    
+    # Created inside the running event loop, which its gRPC channel is bound to, and
+    # closed before asyncio.run tears that loop down
+    async with client.get_service("GoogleAdsService", is_async=True) as googleads_service:
+        async def list_ads(ad_group_id):
+            async with slots:
+                return await alist_ads_in_ad_group(client, customer_id, ad_group_id, googleads_service)
         
-        ads.append(ad_info)
+        return await asyncio.gather(*(list_ads(ad_group_id) for ad_group_id in ad_group_ids))
+
+def list_ads_for_campaign(client, customer_id, campaign_id, max_concurrency=MAX_CONCURRENT_AD_GROUP_QUERIES):
+    """List the ads of every active ad group in a campaign, querying the ad groups concurrently"""
     
+    ad_groups = list_ad_groups(client, customer_id, campaign_id)
+    
+    ads_per_group = asyncio.run(
+        alist_ads_many(client, customer_id, [ag['id'] for ag in ad_groups], max_concurrency)
+    )
+    
+    return [ad for ads in ads_per_group for ad in ads]
+
+def get_ads_summary_cached(client, customer_id, ad_group_id, ttl=ADS_CACHE_TTL_SECONDS):
+    """list_ads_summary, reusing the result fetched for the same ad group within ttl seconds"""
+    key = (customer_id, str(ad_group_id))
+    cached = _ads_cache.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    ads = list_ads_summary(client, customer_id, ad_group_id)
+    _ads_cache[key] = (time.monotonic(), ads)
     return ads
 
+def find_ad_cached(client, customer_id, ad_group_id, ad_id, ttl=ADS_CACHE_TTL_SECONDS):
+    """get_ad_by_id, reusing the ad fetched with the same IDs within ttl seconds (None if absent)"""
+    ad_id = str(ad_id)
+    if not ad_id.isdigit():
+        return None  # Ad IDs are numeric, so nothing can match
+    
+    ad_key = (customer_id, str(ad_group_id), ad_id)
+    cached = _ad_cache.get(ad_key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    
+    ad = get_ad_by_id(client, customer_id, ad_group_id, ad_id)
+    _ad_cache[ad_key] = (time.monotonic(), ad)
+    return ad
+
 def display_ad_details(ad):
     """Display detailed information about an ad"""
     
@@ -197,11 +349,30 @@ def display_ad_details(ad):
     
     print(f"{'='*80}")
 
-def create_responsive_search_ad(client, customer_id, ad_group_id, headlines, descriptions, final_urls, ad_name=None):
-    """Create a new responsive search ad"""
+def validate_responsive_search_ad(headlines, descriptions, final_urls):
+    """Raise ValueError for input the API would reject, before any request is sent"""
+    
+    if not MIN_HEADLINES <= len(headlines) <= MAX_HEADLINES:
+        raise ValueError(f"{MIN_HEADLINES}-{MAX_HEADLINES} headlines required, got {len(headlines)}")
+    for headline in headlines:
+        if len(headline) > MAX_HEADLINE_LENGTH:
+            raise ValueError(f"Headline too long ({len(headline)} chars, max {MAX_HEADLINE_LENGTH}): {headline}")
+    
+    if not MIN_DESCRIPTIONS <= len(descriptions) <= MAX_DESCRIPTIONS:
+        raise ValueError(f"{MIN_DESCRIPTIONS}-{MAX_DESCRIPTIONS} descriptions required, got {len(descriptions)}")
+    for description in descriptions:
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            raise ValueError(f"Description too long ({len(description)} chars, max {MAX_DESCRIPTION_LENGTH}): {description}")
+    
+    if not final_urls:
+        raise ValueError("At least 1 final URL required")
+
+def build_responsive_search_ad_operation(client, customer_id, ad_group_id, headlines, descriptions, final_urls, ad_name=None):
+    """Build the AdGroupAdOperation that creates a responsive search ad"""
     
-    ad_group_ad_service = client.get_service("AdGroupAdService")
-    googleads_service = client.get_service("GoogleAdsService")
+    validate_responsive_search_ad(headlines, descriptions, final_urls)
+    
+    googleads_service = get_service(client, "GoogleAdsService")
     
     operation = client.get_type("AdGroupAdOperation")
     ad_group_ad = operation.create
@@ -219,31 +390,73 @@ def create_responsive_search_ad(client, customer_id, ad_group_id, headlines, des
     # Create responsive search ad
     responsive_search_ad = ad_group_ad.ad.responsive_search_ad
     
-    # Add headlines
+    # Add headlines and descriptions; add() builds each AdTextAsset in place,
+    # where appending a separately built one would allocate it and then copy it
     for headline_text in headlines:
-        headline = client.get_type("AdTextAsset")
-        headline.text = headline_text
-        responsive_search_ad.headlines.append(headline)
+        responsive_search_ad.headlines.add(text=headline_text)
     
-    # Add descriptions
     for desc_text in descriptions:
-        description = client.get_type("AdTextAsset")
-        description.text = desc_text
-        responsive_search_ad.descriptions.append(description)
+        responsive_search_ad.descriptions.add(text=desc_text)
     
     # Set final URLs
     ad_group_ad.ad.final_urls.extend(final_urls)
     
+    return operation
+
+def create_responsive_search_ad(client, customer_id, ad_group_id, headlines, descriptions, final_urls, ad_name=None):
+    """Create a new responsive search ad"""
+    
+    ad_group_ad_service = get_service(client, "AdGroupAdService")
+    
+    operation = build_responsive_search_ad_operation(
+        client, customer_id, ad_group_id, headlines, descriptions, final_urls, ad_name
+    )
+    
     # Execute the operation
     response = ad_group_ad_service.mutate_ad_group_ads(
         customer_id=customer_id,
         operations=[operation]
     )
     
+    # The ad group has a new ad, so its cached listing is stale
+    _ads_cache.pop((customer_id, str(ad_group_id)), None)
+    
     return response.results[0].resource_name
 
-def duplicate_ad(client, customer_id, source_ad, target_ad_group_id=None, modifications=None):
-    """Duplicate an existing ad, optionally with modifications"""
+def create_responsive_search_ads_batch(client, customer_id, specs):
+    """Create several responsive search ads with a single GoogleAdsService.mutate request
+    
+    Each spec is a dict of create_responsive_search_ad arguments (ad_group_id,
+    headlines, descriptions, final_urls and optionally ad_name). The request is
+    atomic: either every ad is created or none is. Returns the new resource names
+    in spec order.
+    """
+    
+    googleads_service = get_service(client, "GoogleAdsService")
+    
+    mutate_operations = []
+    for spec in specs:
+        mutate_operation = client.get_type("MutateOperation")
+        client.copy_from(
+            mutate_operation.ad_group_ad_operation,
+            build_responsive_search_ad_operation(client, customer_id, **spec)
+        )
+        mutate_operations.append(mutate_operation)
+    
+    # Execute every operation in one round trip
+    response = googleads_service.mutate(
+        customer_id=customer_id,
+        mutate_operations=mutate_operations
+    )
+    
+    # The ad groups have new ads, so their cached listings are stale
+    for spec in specs:
+        _ads_cache.pop((customer_id, str(spec['ad_group_id'])), None)
+    
+    return [result.ad_group_ad_result.resource_name for result in response.mutate_operation_responses]
+
+def duplicate_ad_spec(source_ad, target_ad_group_id=None, modifications=None):
+    """create_responsive_search_ad arguments for a copy of an ad, optionally with modifications"""
     
     # Use source ad group if target not specified
     if not target_ad_group_id:
@@ -263,32 +476,55 @@ def duplicate_ad(client, customer_id, source_ad, target_ad_group_id=None, modifi
         if 'final_urls' in modifications:
             final_urls = modifications['final_urls']
     
-    # Create new ad name
-    ad_name = f"Copy of {source_ad['name']}"
+    return {
+        'ad_group_id': target_ad_group_id,
+        'headlines': headlines,
+        'descriptions': descriptions,
+        'final_urls': final_urls,
+        'ad_name': f"Copy of {source_ad['name']}"
+    }
+
+def duplicate_ad(client, customer_id, source_ad, target_ad_group_id=None, modifications=None):
+    """Duplicate an existing ad, optionally with modifications"""
     
-    # Create the ad
     return create_responsive_search_ad(
         client=client,
         customer_id=customer_id,
-        ad_group_id=target_ad_group_id,
-        headlines=headlines,
-        descriptions=descriptions,
-        final_urls=final_urls,
-        ad_name=ad_name
+        **duplicate_ad_spec(source_ad, target_ad_group_id, modifications)
     )
 
-def save_ad_to_file(ad, filename=None):
+def write_json(obj, filename, compact=False):
+    """Write obj as UTF-8 JSON; compact drops the indentation for files nobody reads by eye"""
+    
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=ORJSON_COMPACT if compact else ORJSON_INDENT))
+        return
+
+    # Ad text is written as-is rather than \u-escaped, through one large buffer
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if compact:
+            json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
+def save_ad_to_file(ad, filename=None, compact=False):
     """Save ad details to a JSON file for reference"""
     
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join(REPORTS_DIR, f"ad_details_{ad['id']}_{timestamp}.json")
     
-    with open(filename, 'w') as f:
-        json.dump(ad, f, indent=2)
+    write_json(ad, filename, compact)
     
     return filename
 
+def prompt_ad_group_id(label, last_ad_group_id=None):
+    """Ask for an ad group ID; a blank answer reuses the last one entered"""
+    if last_ad_group_id:
+        return input(f"\n{label} (blank = {last_ad_group_id}): ").strip() or last_ad_group_id
+    return input(f"\n{label}: ").strip()
+
 def interactive_menu():
     """Interactive menu for managing Google Ads"""
     
@@ -309,9 +545,19 @@ def interactive_menu():
     print(f"\n✅ Using Customer ID: {customer_id}")
     
     try:
-        client = get_google_ads_client()
+        # Keepalive stops the connection going cold while the menu waits for input.
+        # It applies to every Google Ads channel this process creates, which here is
+        # only the menu's own
+        if not enable_google_ads_keepalive():
+            print("⚠️  gRPC keepalive unavailable with this google-ads version; idle connections may be dropped")
+        
+        # Raw protobuf rows skip proto-plus wrapping on every field read
+        client = get_google_ads_client(use_proto_plus=False)
         print(f"✅ Client initialized with login_customer_id: {client.login_customer_id}")
         
+        # Options 3, 4, 5 and 7 usually follow each other for the same ad group
+        last_ad_group_id = None
+        
         while True:
             print("\n" + "-"*80)
             print("📋 MAIN MENU")
@@ -323,6 +569,7 @@ def interactive_menu():
             print("5. Duplicate an ad")
             print("6. Create a new ad")
             print("7. Save ad details to file")
+            print("8. View all ads in a campaign")
             print("0. Exit")
             
             choice = input("\nEnter your choice: ").strip()
@@ -344,8 +591,11 @@ def interactive_menu():
                     print(f"\n✅ Found {len(campaigns)} active campaigns:")
                     print(f"{'ID':<15} {'Name':<40} {'Type':<20}")
                     print("-"*80)
-                    for campaign in campaigns:
-                        print(f"{campaign['id']:<15} {campaign['name']:<40} {campaign['type']:<20}")
+                    # One write for the whole table instead of a print per row
+                    sys.stdout.write("".join(
+                        f"{campaign['id']:<15} {campaign['name']:<40} {campaign['type']:<20}\n"
+                        for campaign in campaigns
+                    ))
                 except Exception as e:
                     error_str = str(e)
                     if "USER_PERMISSION_DENIED" in error_str or "permission" in error_str.lower():
@@ -375,15 +625,17 @@ def interactive_menu():
                 print(f"\n✅ Found {len(ad_groups)} active ad groups:")
                 print(f"{'ID':<15} {'Name':<40} {'Status':<15}")
                 print("-"*80)
-                for ag in ad_groups:
-                    print(f"{ag['id']:<15} {ag['name']:<40} {ag['status']:<15}")
+                sys.stdout.write("".join(
+                    f"{ag['id']:<15} {ag['name']:<40} {ag['status']:<15}\n"
+                    for ag in ad_groups
+                ))
             
             elif choice == "3":
                 # View ads in ad group
-                ad_group_id = input("\nEnter Ad Group ID: ").strip()
+                ad_group_id = last_ad_group_id = prompt_ad_group_id("Enter Ad Group ID", last_ad_group_id)
                 print(f"\n📊 Fetching ads in ad group {ad_group_id}...")
                 
-                ads = list_ads_in_ad_group(client, customer_id, ad_group_id)
+                ads = get_ads_summary_cached(client, customer_id, ad_group_id)
                 
                 if not ads:
                     print("❌ No ads found in this ad group.")
@@ -392,22 +644,18 @@ def interactive_menu():
                 print(f"\n✅ Found {len(ads)} ads:")
                 print(f"{'ID':<15} {'Name':<30} {'Type':<25} {'Status':<15} {'Approval':<15}")
                 print("-"*100)
-                for ad in ads:
-                    print(f"{ad['id']:<15} {ad['name'][:29]:<30} {ad['type']:<25} {ad['status']:<15} {ad['approval_status']:<15}")
+                sys.stdout.write("".join(
+                    f"{ad['id']:<15} {ad['name'][:29]:<30} {ad['type']:<25} {ad['status']:<15} {ad['approval_status']:<15}\n"
+                    for ad in ads
+                ))
             
             elif choice == "4":
                 # View detailed ad information
-                ad_group_id = input("\nEnter Ad Group ID: ").strip()
+                ad_group_id = last_ad_group_id = prompt_ad_group_id("Enter Ad Group ID", last_ad_group_id)
                 ad_id = input("Enter Ad ID: ").strip()
                 
                 print(f"\n📊 Fetching ad details...")
-                ads = list_ads_in_ad_group(client, customer_id, ad_group_id)
-                
-                selected_ad = None
-                for ad in ads:
-                    if str(ad['id']) == ad_id:
-                        selected_ad = ad
-                        break
+                selected_ad = find_ad_cached(client, customer_id, ad_group_id, ad_id)
                 
                 if not selected_ad:
                     print("❌ Ad not found in this ad group.")
@@ -417,17 +665,11 @@ def interactive_menu():
             
             elif choice == "5":
                 # Duplicate an ad
-                ad_group_id = input("\nEnter Source Ad Group ID: ").strip()
+                ad_group_id = last_ad_group_id = prompt_ad_group_id("Enter Source Ad Group ID", last_ad_group_id)
                 ad_id = input("Enter Ad ID to duplicate: ").strip()
                 
                 print(f"\n📊 Fetching ad details...")
-                ads = list_ads_in_ad_group(client, customer_id, ad_group_id)
-                
-                source_ad = None
-                for ad in ads:
-                    if str(ad['id']) == ad_id:
-                        source_ad = ad
-                        break
+                source_ad = find_ad_cached(client, customer_id, ad_group_id, ad_id)
                 
                 if not source_ad:
                     print("❌ Ad not found.")
@@ -435,76 +677,80 @@ def interactive_menu():
                 
                 display_ad_details(source_ad)
                 
-                # Ask if they want to modify
-                modify = input("\nDo you want to modify the ad before duplicating? (y/n): ").strip().lower()
-                modifications = None
-                
-                if modify == 'y':
-                    print("\nLeave blank to keep original values.")
-                    
-                    # Modify headlines
-                    print(f"\nCurrent headlines ({len(source_ad['headlines'])}):")
-                    for i, h in enumerate(source_ad['headlines'], 1):
-                        print(f"  {i}. {h['text']}")
+                # Collect every copy first so they are all created in one request
+                duplicate_specs = []
+                while True:
+                    # Ask if they want to modify
+                    modify = input("\nDo you want to modify the ad before duplicating? (y/n): ").strip().lower()
+                    modifications = None
                     
-                    modify_headlines = input("\nModify headlines? (y/n): ").strip().lower()
-                    if modify_headlines == 'y':
-                        new_headlines = []
-                        print("Enter new headlines (press Enter with empty line to finish, max 15):")
-                        while len(new_headlines) < 15:
-                            headline = input(f"Headline {len(new_headlines) + 1}: ").strip()
-                            if not headline:
-                                break
-                            if len(headline) <= 30:
-                                new_headlines.append(headline)
-                            else:
-                                print(f"  ⚠️  Headline too long ({len(headline)} chars, max 30)")
+                    if modify == 'y':
+                        print("\nLeave blank to keep original values.")
+                        
+                        # Modify headlines
+                        print(f"\nCurrent headlines ({len(source_ad['headlines'])}):")
+                        for i, h in enumerate(source_ad['headlines'], 1):
+                            print(f"  {i}. {h['text']}")
+                        
+                        modify_headlines = input("\nModify headlines? (y/n): ").strip().lower()
+                        if modify_headlines == 'y':
+                            new_headlines = []
+                            print("Enter new headlines (press Enter with empty line to finish, max 15):")
+                            while len(new_headlines) < 15:
+                                headline = input(f"Headline {len(new_headlines) + 1}: ").strip()
+                                if not headline:
+                                    break
+                                if len(headline) <= 30:
+                                    new_headlines.append(headline)
+                                else:
+                                    print(f"  ⚠️  Headline too long ({len(headline)} chars, max 30)")
+                            
+                            if new_headlines:
+                                if not modifications:
+                                    modifications = {}
+                                modifications['headlines'] = new_headlines
                         
-                        if new_headlines:
-                            if not modifications:
-                                modifications = {}
-                            modifications['headlines'] = new_headlines
+                        # Modify descriptions
+                        print(f"\nCurrent descriptions ({len(source_ad['descriptions'])}):")
+                        for i, d in enumerate(source_ad['descriptions'], 1):
+                            print(f"  {i}. {d['text']}")
+                        
+                        modify_descriptions = input("\nModify descriptions? (y/n): ").strip().lower()
+                        if modify_descriptions == 'y':
+                            new_descriptions = []
+                            print("Enter new descriptions (press Enter with empty line to finish, max 4):")
+                            while len(new_descriptions) < 4:
+                                desc = input(f"Description {len(new_descriptions) + 1}: ").strip()
+                                if not desc:
+                                    break
+                                if len(desc) <= 90:
+                                    new_descriptions.append(desc)
+                                else:
+                                    print(f"  ⚠️  Description too long ({len(desc)} chars, max 90)")
+                            
+                            if new_descriptions:
+                                if not modifications:
+                                    modifications = {}
+                                modifications['descriptions'] = new_descriptions
                     
-                    # Modify descriptions
-                    print(f"\nCurrent descriptions ({len(source_ad['descriptions'])}):")
-                    for i, d in enumerate(source_ad['descriptions'], 1):
-                        print(f"  {i}. {d['text']}")
+                    # Ask for target ad group
+                    same_group = input(f"\nDuplicate in same ad group ({source_ad['ad_group_name']})? (y/n): ").strip().lower()
+                    target_ad_group_id = None
+                    if same_group != 'y':
+                        target_ad_group_id = input("Enter target Ad Group ID: ").strip()
                     
-                    modify_descriptions = input("\nModify descriptions? (y/n): ").strip().lower()
-                    if modify_descriptions == 'y':
-                        new_descriptions = []
-                        print("Enter new descriptions (press Enter with empty line to finish, max 4):")
-                        while len(new_descriptions) < 4:
-                            desc = input(f"Description {len(new_descriptions) + 1}: ").strip()
-                            if not desc:
-                                break
-                            if len(desc) <= 90:
-                                new_descriptions.append(desc)
-                            else:
-                                print(f"  ⚠️  Description too long ({len(desc)} chars, max 90)")
-                        
-                        if new_descriptions:
-                            if not modifications:
-                                modifications = {}
-                            modifications['descriptions'] = new_descriptions
-                
-                # Ask for target ad group
-                same_group = input(f"\nDuplicate in same ad group ({source_ad['ad_group_name']})? (y/n): ").strip().lower()
-                target_ad_group_id = None
-                if same_group != 'y':
-                    target_ad_group_id = input("Enter target Ad Group ID: ").strip()
+                    duplicate_specs.append(duplicate_ad_spec(source_ad, target_ad_group_id, modifications))
+                    
+                    another = input("\nAdd another copy of this ad? (y/n): ").strip().lower()
+                    if another != 'y':
+                        break
                 
-                print("\n🚀 Creating duplicate ad...")
+                print(f"\n🚀 Creating {len(duplicate_specs)} duplicate ad(s)...")
                 try:
-                    new_ad_resource = duplicate_ad(
-                        client=client,
-                        customer_id=customer_id,
-                        source_ad=source_ad,
-                        target_ad_group_id=target_ad_group_id,
-                        modifications=modifications
-                    )
+                    new_ad_resources = create_responsive_search_ads_batch(client, customer_id, duplicate_specs)
                     print(f"✅ Ad duplicated successfully!")
-                    print(f"Resource name: {new_ad_resource}")
+                    for new_ad_resource in new_ad_resources:
+                        print(f"Resource name: {new_ad_resource}")
                 except Exception as e:
                     print(f"❌ Error duplicating ad: {e}")
             
@@ -581,34 +827,27 @@ def interactive_menu():
                         # Save details
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         report_file = os.path.join(REPORTS_DIR, f"ad_created_{timestamp}.json")
-                        with open(report_file, 'w') as f:
-                            json.dump({
-                                'created_at': datetime.now().isoformat(),
-                                'customer_id': customer_id,
-                                'ad_group_id': ad_group_id,
-                                'ad_name': ad_name,
-                                'headlines': headlines,
-                                'descriptions': descriptions,
-                                'final_urls': final_urls,
-                                'resource_name': new_ad_resource
-                            }, f, indent=2)
+                        write_json({
+                            'created_at': datetime.now().isoformat(),
+                            'customer_id': customer_id,
+                            'ad_group_id': ad_group_id,
+                            'ad_name': ad_name,
+                            'headlines': headlines,
+                            'descriptions': descriptions,
+                            'final_urls': final_urls,
+                            'resource_name': new_ad_resource
+                        }, report_file)
                         print(f"📄 Details saved to: {report_file}")
                     except Exception as e:
                         print(f"❌ Error creating ad: {e}")
             
             elif choice == "7":
                 # Save ad details
-                ad_group_id = input("\nEnter Ad Group ID: ").strip()
+                ad_group_id = last_ad_group_id = prompt_ad_group_id("Enter Ad Group ID", last_ad_group_id)
                 ad_id = input("Enter Ad ID: ").strip()
                 
                 print(f"\n📊 Fetching ad details...")
-                ads = list_ads_in_ad_group(client, customer_id, ad_group_id)
-                
-                selected_ad = None
-                for ad in ads:
-                    if str(ad['id']) == ad_id:
-                        selected_ad = ad
-                        break
+                selected_ad = find_ad_cached(client, customer_id, ad_group_id, ad_id)
                 
                 if not selected_ad:
                     print("❌ Ad not found.")
@@ -617,6 +856,25 @@ def interactive_menu():
                 filename = save_ad_to_file(selected_ad)
                 print(f"✅ Ad details saved to: {filename}")
             
+            elif choice == "8":
+                # View ads across all ad groups in a campaign
+                campaign_id = input("\nEnter Campaign ID: ").strip()
+                print(f"\n📊 Fetching ads in every ad group of campaign {campaign_id}...")
+                
+                ads = list_ads_for_campaign(client, customer_id, campaign_id)
+                
+                if not ads:
+                    print("❌ No ads found in this campaign's active ad groups.")
+                    continue
+                
+                print(f"\n✅ Found {len(ads)} ads:")
+                print(f"{'Ad Group':<30} {'ID':<15} {'Name':<30} {'Type':<25} {'Status':<15}")
+                print("-"*115)
+                sys.stdout.write("".join(
+                    f"{ad['ad_group_name'][:29]:<30} {ad['id']:<15} {ad['name'][:29]:<30} {ad['type']:<25} {ad['status']:<15}\n"
+                    for ad in ads
+                ))
+            
             else:
                 print("❌ Invalid choice. Please try again.")
     
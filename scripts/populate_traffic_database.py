@@ -167,6 +167,18 @@ def get_analytics_data_with_source_medium(days: int = 30):
     return dict(analytics_data)
 
 
+def get_lookup_ids(cursor, table, names):
+    """Ensure names exist in a source/medium lookup table and map them to ids."""
+    cursor.executemany(f"INSERT IGNORE INTO {table} (name) VALUES (%s)", [(name,) for name in names])
+    # Resolve each requested name with the table's own collation, which may match a row
+    # stored under a different case, trailing spaces or accents
+    ids = {}
+    for name in names:
+        cursor.execute(f"SELECT id FROM {table} WHERE name = %s", (name,))
+        ids[name] = cursor.fetchone()[0]
+    return ids
+
+
 def store_traffic_data(properties, analytics_data, days):
     """Store traffic data in database."""
     connection = get_db_connection()
@@ -181,6 +193,10 @@ def store_traffic_data(properties, analytics_data, days):
         records_updated = 0
         
         print(f"\n💾 Storing traffic data in database...")
+
+        combos = {key for sources in analytics_data.values() for key in sources}
+        source_ids = get_lookup_ids(cursor, 'traffic_source', {source for source, _ in combos})
+        medium_ids = get_lookup_ids(cursor, 'traffic_medium', {medium for _, medium in combos})
         
         for prop in properties:
             url_path = prop['url_path']
@@ -202,7 +218,7 @@ def store_traffic_data(properties, analytics_data, days):
                 cursor.execute("""
                     INSERT INTO property_traffic_detail 
                     (reference, house_name, property_url, report_date, period_days, 
-                     traffic_source, traffic_medium, sessions, pageviews, users, 
+                     source_id, medium_id, sessions, pageviews, users, 
                      avg_session_duration, bounce_rate)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     ON DUPLICATE KEY UPDATE
@@ -218,8 +234,8 @@ def store_traffic_data(properties, analytics_data, days):
                     prop['url'],
                     report_date,
                     days,
-                    source,
-                    medium,
+                    source_ids[source],
+                    medium_ids[medium],
                     metrics['sessions'],
                     metrics['pageviews'],
                     metrics['users'],
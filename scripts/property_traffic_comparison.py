@@ -48,29 +48,31 @@ def generate_traffic_comparison_html(days=30):
             p.reference,
             p.house_name,
             p.price,
-            SUM(CASE WHEN ptd.traffic_source = 'facebook' AND ptd.traffic_medium IN ('catalog', 'fb_ads', 'paid') 
+            SUM(CASE WHEN ts.name = 'facebook' AND tm.name IN ('catalog', 'fb_ads', 'paid') 
                 THEN ptd.sessions ELSE 0 END) as facebook_paid,
-            SUM(CASE WHEN ptd.traffic_source LIKE '%facebook%' AND ptd.traffic_medium NOT IN ('catalog', 'fb_ads', 'paid')
+            SUM(CASE WHEN ts.name LIKE '%facebook%' AND tm.name NOT IN ('catalog', 'fb_ads', 'paid')
                 THEN ptd.sessions ELSE 0 END) as facebook_social,
-            SUM(CASE WHEN ptd.traffic_source = 'google' AND ptd.traffic_medium = 'cpc' 
+            SUM(CASE WHEN ts.name = 'google' AND tm.name = 'cpc' 
                 THEN ptd.sessions ELSE 0 END) as google_paid,
-            SUM(CASE WHEN ptd.traffic_source = 'google' AND ptd.traffic_medium = 'organic' 
+            SUM(CASE WHEN ts.name = 'google' AND tm.name = 'organic' 
                 THEN ptd.sessions ELSE 0 END) as google_organic,
-            SUM(CASE WHEN ptd.traffic_source = 'google.com' AND ptd.traffic_medium = 'social' 
+            SUM(CASE WHEN ts.name = 'google.com' AND tm.name = 'social' 
                 THEN ptd.sessions ELSE 0 END) as google_social,
-            SUM(CASE WHEN ptd.traffic_source LIKE '%linkedin%' 
+            SUM(CASE WHEN ts.name LIKE '%linkedin%' 
                 THEN ptd.sessions ELSE 0 END) as linkedin,
-            SUM(CASE WHEN ptd.traffic_source = 'places.je' 
+            SUM(CASE WHEN ts.name = 'places.je' 
                 THEN ptd.sessions ELSE 0 END) as places_je,
-            SUM(CASE WHEN ptd.traffic_source LIKE '%bailiwick%' 
+            SUM(CASE WHEN ts.name LIKE '%bailiwick%' 
                 THEN ptd.sessions ELSE 0 END) as bailiwick,
-            SUM(CASE WHEN ptd.traffic_source LIKE '%mailchimp%' OR ptd.traffic_medium = 'email' 
+            SUM(CASE WHEN ts.name LIKE '%mailchimp%' OR tm.name = 'email' 
                 THEN ptd.sessions ELSE 0 END) as email,
             SUM(ptd.sessions) as total_sessions,
             SUM(ptd.pageviews) as total_pageviews,
             SUM(ptd.users) as total_users
         FROM properties p
         LEFT JOIN property_traffic_detail ptd ON p.reference = ptd.reference AND ptd.period_days = %s
+        LEFT JOIN traffic_source ts ON ts.id = ptd.source_id
+        LEFT JOIN traffic_medium tm ON tm.id = ptd.medium_id
         WHERE p.is_active = 1
         GROUP BY p.reference, p.house_name, p.price
         HAVING total_sessions > 0
@@ -67,28 +67,30 @@ def view_property_traffic(property_ref=None, days=30, sort_by='sessions'):
         # Build query
         query = """
             SELECT 
-                reference,
-                house_name,
-                traffic_source,
-                traffic_medium,
-                SUM(sessions) as total_sessions,
-                SUM(pageviews) as total_pageviews,
-                SUM(users) as total_users,
-                AVG(avg_session_duration) as avg_duration,
-                AVG(bounce_rate) as avg_bounce_rate,
-                MAX(report_date) as last_updated
-            FROM property_traffic_detail
-            WHERE period_days = %s
+                ptd.reference,
+                ptd.house_name,
+                ts.name as traffic_source,
+                tm.name as traffic_medium,
+                SUM(ptd.sessions) as total_sessions,
+                SUM(ptd.pageviews) as total_pageviews,
+                SUM(ptd.users) as total_users,
+                AVG(ptd.avg_session_duration) as avg_duration,
+                AVG(ptd.bounce_rate) as avg_bounce_rate,
+                MAX(ptd.report_date) as last_updated
+            FROM property_traffic_detail ptd
+            JOIN traffic_source ts ON ts.id = ptd.source_id
+            JOIN traffic_medium tm ON tm.id = ptd.medium_id
+            WHERE ptd.period_days = %s
         """
         
         params = [days]
         
         if property_ref:
-            query += " AND reference = %s"
+            query += " AND ptd.reference = %s"
             params.append(property_ref)
         
         query += """
-            GROUP BY reference, house_name, traffic_source, traffic_medium
+            GROUP BY ptd.reference, ptd.house_name, ts.name, tm.name
             ORDER BY total_sessions DESC
         """
         
@@ -117,17 +119,19 @@ def compare_traffic_sources(days=30):
         
         cursor.execute("""
             SELECT 
-                traffic_source,
-                traffic_medium,
-                COUNT(DISTINCT reference) as properties_count,
-                SUM(sessions) as total_sessions,
-                SUM(pageviews) as total_pageviews,
-                SUM(users) as total_users,
-                AVG(avg_session_duration) as avg_duration,
-                AVG(bounce_rate) as avg_bounce_rate
-            FROM property_traffic_detail
-            WHERE period_days = %s
-            GROUP BY traffic_source, traffic_medium
+                ts.name as traffic_source,
+                tm.name as traffic_medium,
+                COUNT(DISTINCT ptd.reference) as properties_count,
+                SUM(ptd.sessions) as total_sessions,
+                SUM(ptd.pageviews) as total_pageviews,
+                SUM(ptd.users) as total_users,
+                AVG(ptd.avg_session_duration) as avg_duration,
+                AVG(ptd.bounce_rate) as avg_bounce_rate
+            FROM property_traffic_detail ptd
+            JOIN traffic_source ts ON ts.id = ptd.source_id
+            JOIN traffic_medium tm ON tm.id = ptd.medium_id
+            WHERE ptd.period_days = %s
+            GROUP BY ts.name, tm.name
             ORDER BY total_sessions DESC
         """, (days,))
         
@@ -174,7 +174,15 @@ GOOGLE_ADS_DEVELOPER_TOKEN = os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN")
 GOOGLE_ADS_JSON_KEY_PATH = os.getenv("GOOGLE_ADS_JSON_KEY_PATH")  # New: path to your service account JSON key
 GOOGLE_ADS_LOGIN_CUSTOMER_ID = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")  # Usually your manager account ID (required for service accounts)
 
-def load_google_ads_config():
+# gRPC keepalive pings, so idle connections survive while an interactive tool waits for input;
+# see enable_google_ads_keepalive
+GOOGLE_ADS_KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
+def load_google_ads_config(use_proto_plus=True):
     """Load Google Ads configuration for service account authentication"""
     if not all([GOOGLE_ADS_DEVELOPER_TOKEN, GOOGLE_ADS_JSON_KEY_PATH, GOOGLE_ADS_LOGIN_CUSTOMER_ID]):
         raise ValueError("Missing required Google Ads service account config in .env file.")
@@ -183,16 +191,41 @@ def load_google_ads_config():
         "developer_token": GOOGLE_ADS_DEVELOPER_TOKEN,
         "json_key_file_path": GOOGLE_ADS_JSON_KEY_PATH,
         "login_customer_id": GOOGLE_ADS_LOGIN_CUSTOMER_ID,  # Manager account ID
-        "use_proto_plus": True,
+        "use_proto_plus": use_proto_plus,
     }
     return config
 
-def get_google_ads_client():
-    """Get authenticated Google Ads API client using service account"""
+def enable_google_ads_keepalive():
+    """Turn on gRPC keepalive for every Google Ads channel created from now on, process-wide
+
+    google-ads has no per-client or per-service channel options: every service
+    channel is built from the module-level _GRPC_CHANNEL_OPTIONS list (which the
+    library itself extends for http_proxy). This adds GOOGLE_ADS_KEEPALIVE_OPTIONS
+    to that list, so it affects all clients in the process, including ones
+    created elsewhere. Returns False, changing nothing, if the installed library
+    no longer has the list.
+    """
+    try:
+        from google.ads.googleads import client as google_ads_client
+    except ImportError:
+        raise ImportError("Google Ads API not available. Install with: pip install google-ads")
+
+    channel_options = getattr(google_ads_client, "_GRPC_CHANNEL_OPTIONS", None)
+    if not isinstance(channel_options, list):
+        return False
+    channel_options.extend(o for o in GOOGLE_ADS_KEEPALIVE_OPTIONS if o not in channel_options)
+    return True
+
+def get_google_ads_client(use_proto_plus=True):
+    """Get authenticated Google Ads API client using service account
+
+    Pass use_proto_plus=False to get raw protobuf messages, which are much
+    cheaper to read field by field; enum fields are then plain ints.
+    """
     try:
         from google.ads.googleads.client import GoogleAdsClient
 
-        config = load_google_ads_config()
+        config = load_google_ads_config(use_proto_plus)
         client = GoogleAdsClient.load_from_dict(config)
         return client
     except ImportError:
@@ -3,9 +3,12 @@ Google Analytics 4 Client Module
 Shared functions for GA4 API interactions
 """
 
+import hashlib
 import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator
+import pandas as pd
 from google.analytics.data_v1beta.types import (
     DateRange,
     Dimension,
@@ -16,6 +19,10 @@ from google.analytics.data_v1beta.types import (
 
 from .config import get_ga4_client, GA4_PROPERTY_ID, REPORTS_DIR
 
+# Fetched report frames, reused by reruns within REPORT_CACHE_MAX_AGE_HOURS
+REPORT_CACHE_DIR = os.path.join(REPORTS_DIR, "cache")
+REPORT_CACHE_MAX_AGE_HOURS = 6
+
 def create_date_range(start_date: str, end_date: str) -> DateRange:
     """Create a DateRange object"""
     return DateRange(start_date=start_date, end_date=end_date)
@@ -30,7 +37,7 @@ def create_metrics(metric_names: List[str]) -> List[Metric]:
 
 def run_report(dimensions: List[str], metrics: List[str], date_ranges: List[DateRange],
                order_bys: List[OrderBy] = None, limit: int = 10000, 
-               dimension_filter: Any = None) -> Any:
+               dimension_filter: Any = None, offset: int = 0) -> Any:
     """
     Run a GA4 report with the given parameters
 
@@ -41,6 +48,7 @@ def run_report(dimensions: List[str], metrics: List[str], date_ranges: List[Date
         order_bys: Optional list of OrderBy objects
         limit: Maximum number of rows to return
         dimension_filter: Optional FilterExpression for filtering dimensions
+        offset: Row offset of the first row to return (for paging)
 
     Returns:
         GA4 RunReportResponse
@@ -59,10 +67,88 @@ def run_report(dimensions: List[str], metrics: List[str], date_ranges: List[Date
     if dimension_filter:
         request_params["dimension_filter"] = dimension_filter
 
+    if offset:
+        request_params["offset"] = offset
+
     request = RunReportRequest(**request_params)
 
     return client.run_report(request)
 
+def iter_report_rows(dimensions: List[str], metrics: List[str], date_ranges: List[DateRange],
+                     order_bys: List[OrderBy] = None, page_size: int = 10000,
+                     dimension_filter: Any = None) -> Iterator[Any]:
+    """
+    Yield every row of a GA4 report, requesting it page by page
+
+    A single run_report call silently stops at its limit; this keeps paging
+    with offset until the response's row_count has been reached.
+    """
+    offset = 0
+    while True:
+        response = run_report(dimensions, metrics, date_ranges, order_bys=order_bys,
+                              limit=page_size, dimension_filter=dimension_filter, offset=offset)
+        yield from response.rows
+        offset += len(response.rows)
+        if not response.rows or offset >= response.row_count:
+            break
+
+def report_rows_to_dataframe(rows: Iterable[Any], columns: List[str],
+                             dtypes: Dict[str, str] = None) -> pd.DataFrame:
+    """
+    Load GA4 report rows into a DataFrame in one pass
+
+    Args:
+        rows: Report rows (response.rows or iter_report_rows output)
+        columns: Column names, dimensions first then metrics, in request order
+        dtypes: Optional column dtypes; metric values arrive as strings
+
+    Returns:
+        DataFrame with one row per report row
+    """
+    df = pd.DataFrame(
+        [[value.value for value in row.dimension_values] + [value.value for value in row.metric_values]
+         for row in rows],
+        columns=columns,
+    )
+    return df.astype(dtypes) if dtypes else df
+
+def report_cache_name(prefix: str, *query_parts: Any) -> str:
+    """Cache file stem: prefix plus a short hash of everything that shapes the cached query"""
+    digest = hashlib.sha256(repr(query_parts).encode('utf-8')).hexdigest()[:12]
+    return f"{prefix}_{digest}"
+
+def load_cached_report_frame(cache_name: str, fetch: Callable[[], pd.DataFrame],
+                             refresh: bool = False, dtypes: Dict[str, str] = None) -> pd.DataFrame:
+    """
+    Return a report DataFrame from the on-disk cache, fetching it when missing or stale
+
+    Frames are cached as CSV, so reading a cached copy never runs code from the file.
+
+    Args:
+        cache_name: File name stem; build it with report_cache_name from every query parameter
+        fetch: Called to build the frame from GA4 on a cache miss
+        refresh: Ignore any cached copy and fetch again
+        dtypes: Column dtypes to restore when reading a cached copy
+
+    Returns:
+        The cached or freshly fetched DataFrame
+    """
+    path = os.path.join(REPORT_CACHE_DIR, f"{cache_name}.csv")
+    max_age_seconds = REPORT_CACHE_MAX_AGE_HOURS * 3600
+
+    if not refresh:
+        try:
+            if time.time() - os.path.getmtime(path) < max_age_seconds:
+                # Empty dimension values stay empty strings rather than NaN
+                return pd.read_csv(path, dtype=dtypes, keep_default_na=False)
+        except OSError:
+            pass  # Not cached yet
+
+    df = fetch()
+    os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+    df.to_csv(path, index=False)
+    return df
+
 def get_yesterday_date() -> str:
     """Get yesterday's date as string"""
     yesterday = datetime.now().date() - timedelta(days=1)
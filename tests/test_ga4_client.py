@@ -11,6 +11,10 @@ from src.ga4_client import (
     create_dimensions,
     create_metrics,
     run_report,
+    iter_report_rows,
+    report_rows_to_dataframe,
+    load_cached_report_frame,
+    report_cache_name,
     get_yesterday_date,
     get_last_30_days_range,
     get_report_filename
@@ -150,4 +154,80 @@ class TestGA4Client:
         date_ranges = [create_date_range("2025-11-01", "2025-11-07")]
 
         with pytest.raises(Exception, match="API Error"):
-            run_report(dimensions, metrics, date_ranges)
\ No newline at end of file
+            run_report(dimensions, metrics, date_ranges)
+
+    @patch('src.ga4_client.get_ga4_client')
+    def test_iter_report_rows_pages_until_row_count(self, mock_get_client):
+        """Test that rows beyond the page size are fetched with offsets"""
+        all_rows = [Mock() for _ in range(5)]
+
+        def paged_report(request):
+            rows = all_rows[request.offset:request.offset + request.limit]
+            return Mock(rows=rows, row_count=len(all_rows))
+
+        mock_client = Mock()
+        mock_client.run_report.side_effect = paged_report
+        mock_get_client.return_value = mock_client
+
+        date_ranges = [create_date_range("2025-11-01", "2025-11-07")]
+        rows = list(iter_report_rows(["pagePath"], ["totalUsers"], date_ranges, page_size=2))
+
+        assert rows == all_rows
+        assert mock_client.run_report.call_count == 3
+        offsets = [call[0][0].offset for call in mock_client.run_report.call_args_list]
+        assert offsets == [0, 2, 4]
+
+    def test_report_rows_to_dataframe(self):
+        """Test converting report rows into a typed DataFrame"""
+        def make_row(dimensions, metrics):
+            return Mock(
+                dimension_values=[Mock(value=value) for value in dimensions],
+                metric_values=[Mock(value=value) for value in metrics]
+            )
+
+        rows = [make_row(["/home"], ["10", "1.5"]), make_row(["/about"], ["3", "0.25"])]
+
+        df = report_rows_to_dataframe(rows, ["page_path", "users", "rate"], {"users": "int64", "rate": "float64"})
+
+        assert list(df.columns) == ["page_path", "users", "rate"]
+        assert df["page_path"].tolist() == ["/home", "/about"]
+        assert df["users"].tolist() == [10, 3]
+        assert df["rate"].tolist() == [1.5, 0.25]
+
+    def test_load_cached_report_frame_reuses_fresh_cache(self, tmp_path):
+        """Test that a fresh cached frame is reused and refresh forces a fetch"""
+        import pandas as pd
+
+        fetch = Mock(return_value=pd.DataFrame({"users": [1, 2]}))
+
+        with patch('src.ga4_client.REPORT_CACHE_DIR', str(tmp_path)):
+            first = load_cached_report_frame("report_2025-11-01", fetch)
+            second = load_cached_report_frame("report_2025-11-01", fetch)
+            assert fetch.call_count == 1
+            assert second["users"].tolist() == first["users"].tolist() == [1, 2]
+
+            load_cached_report_frame("report_2025-11-01", fetch, refresh=True)
+            assert fetch.call_count == 2
+
+    def test_load_cached_report_frame_restores_dtypes(self, tmp_path):
+        """Test that a cached frame reads back with its dtypes and empty strings intact"""
+        import pandas as pd
+
+        dtypes = {"page_path": "category", "users": "int64", "rate": "float64"}
+        frame = pd.DataFrame({"page_path": ["/home", ""], "users": [10, 3], "rate": [1 / 3, 0.25]}).astype(dtypes)
+        fetch = Mock(return_value=frame)
+
+        with patch('src.ga4_client.REPORT_CACHE_DIR', str(tmp_path)):
+            load_cached_report_frame("report_2025-11-01", fetch, dtypes=dtypes)
+            cached = load_cached_report_frame("report_2025-11-01", fetch, dtypes=dtypes)
+
+        assert fetch.call_count == 1
+        pd.testing.assert_frame_equal(cached, frame)
+
+    def test_report_cache_name_changes_with_query(self):
+        """Test that the cache name depends on the query parameters"""
+        name = report_cache_name("report_2025-11-01", ["pagePath"], ["totalUsers"])
+
+        assert name.startswith("report_2025-11-01_")
+        assert name == report_cache_name("report_2025-11-01", ["pagePath"], ["totalUsers"])
+        assert name != report_cache_name("report_2025-11-01", ["pagePath"], ["sessions"])
@@ -0,0 +1,47 @@
+"""
+Tests for campaign_performance.py script
+"""
+
+from unittest.mock import patch
+
+import pandas as pd
+
+from scripts.campaign_performance import (
+    YESTERDAY_CSV_COLUMNS,
+    export_campaign_report,
+    new_page_campaign,
+    yesterday_csv_rows,
+)
+
+
+class TestExportCampaignReport:
+    """Test the campaign CSV export"""
+
+    @patch('scripts.campaign_performance.create_campaign_report_pdf')
+    @patch('scripts.campaign_performance.get_report_filename')
+    @patch('builtins.print')  # Suppress print output
+    def test_csv_matches_dataframe_to_csv(self, mock_print, mock_get_filename, mock_create_pdf, tmp_path):
+        """The streamed CSV has the same bytes as the DataFrame.to_csv export it replaced"""
+        csv_path = tmp_path / 'campaigns.csv'
+        mock_get_filename.return_value = str(csv_path)
+        mock_create_pdf.return_value = str(tmp_path / 'campaigns.pdf')
+
+        campaign_data = {'spring_campaign': new_page_campaign(), 'autumn, "sale"': new_page_campaign()}
+        for campaign_name, users, page_path in [
+            ('spring_campaign', 12, '/properties'),
+            ('spring_campaign', 3, '/home'),
+            ('autumn, "sale"', 7, '/contact'),
+        ]:
+            data = campaign_data[campaign_name]
+            data['total_users'] += users
+            data['source_medium'] = 'mailchimp / email'
+            page = data['pages'][page_path]
+            page.update(users=users, sessions=users + 1, pageviews=users * 2,
+                        avg_session_duration=45.5, bounce_rate=0.35)
+
+        rows = list(yesterday_csv_rows(campaign_data, '2025-11-01'))
+        export_campaign_report(iter(rows), YESTERDAY_CSV_COLUMNS, 'campaign_performance',
+                               '2025-11-01', campaign_data, 22, 2)
+
+        expected = pd.DataFrame(rows, columns=YESTERDAY_CSV_COLUMNS).to_csv(index=False)
+        assert csv_path.read_bytes() == expected.encode('utf-8')
@@ -0,0 +1,36 @@
+"""
+Tests for email_performance.py script
+"""
+
+import pandas as pd
+
+from scripts.email_performance import categorize_email_source, categorize_email_sources
+
+
+class TestCategorizeEmailSources:
+    """Test the vectorized email source categorization"""
+
+    def test_matches_row_by_row_categorization(self):
+        sources = pd.Series([
+            'allislandmedia.cmail20.com / referral',
+            'ALLISLANDMEDIA.CMAIL19.COM / referral',
+            'places.je / email',
+            'Places.JE / referral',
+            'newsletter / email',
+            'EMAIL / campaign',
+            'mailchimp / newsletter',
+            'google / organic',
+            '(direct) / (none)',
+            '',
+        ], index=range(10, 20))
+
+        result = categorize_email_sources(sources)
+
+        assert result.tolist() == [categorize_email_source(source) for source in sources]
+        assert result.index.equals(sources.index)
+
+    def test_first_matching_pattern_wins(self):
+        # Both patterns match; the row-by-row loop returns the earlier category
+        sources = pd.Series(['places.je / email', 'allislandmedia.cmail / places.je'])
+
+        assert categorize_email_sources(sources).tolist() == ['Places.je', 'Bailiwick Express']
@@ -0,0 +1,196 @@
+"""
+Tests for import_property_feed_mariadb.py script
+"""
+
+import os
+import queue
+import threading
+
+import pytest
+from unittest.mock import patch
+from mysql.connector import Error, errorcode
+
+from scripts import import_property_feed_mariadb as feed_import
+from scripts.import_property_feed_mariadb import (
+    parse_property_row, produce_property_rows, read_spool_rows, spool_line, write_property_rows, ET, LOAD_DATA_SQL, UPSERT_SQL
+)
+
+
+def make_row(reference, parish='St Helier'):
+    """A properties row as parse_property_row builds it"""
+    elem = ET.fromstring(
+        f'<property><reference>{reference}</reference><url>https://example.com/{reference}</url>'
+        f'<parish>{parish}</parish><propertytype>Apartment</propertytype><price>450000</price>'
+        f'<bedrooms>2</bedrooms><description>Sea "view"\twith balcony\\terrace</description><image_one/></property>'
+    )
+    return parse_property_row(elem)
+
+
+def as_spooled(row):
+    """A row as it reads back from a spool file: text, with NULLs kept"""
+    return [None if value is None else str(value) for value in row]
+
+
+def queued(rows):
+    """A row queue already holding the rows and the None sentinel"""
+    row_queue = queue.Queue()
+    for row in rows:
+        row_queue.put(row)
+    row_queue.put(None)
+    return row_queue
+
+
+class FakeCursor:
+    """Records the statements a MariaDB cursor would receive"""
+
+    def __init__(self, load_error=None, executemany_error=None):
+        self.load_error = load_error
+        self.executemany_error = executemany_error
+        self.batches = []
+        self.loads = []
+
+    def execute(self, sql, params=()):
+        assert sql == LOAD_DATA_SQL
+        if self.load_error:
+            raise self.load_error
+        self.loads.append(list(read_spool_rows(params[0])))
+
+    def executemany(self, sql, rows):
+        assert sql == UPSERT_SQL
+        if self.executemany_error:
+            raise self.executemany_error
+        self.batches.append(list(rows))
+
+
+class TestParsePropertyRow:
+    """Test the row tuple built for each <property> element"""
+
+    def test_row_matches_upsert_columns(self):
+        row = make_row('REF1')
+
+        assert len(row) == UPSERT_SQL.count('%s')
+        assert row[0] == 'REF1'
+        assert row[5] == 450000.0
+        assert row[9] == 2
+        assert row[-1] == 'St Helier Apartments'
+
+    def test_empty_fields_are_null(self):
+        row = parse_property_row(ET.fromstring(
+            '<property><reference>REF3</reference><url/><parish/><propertytype/><status/><description/></property>'
+        ))
+
+        assert row[1] is None
+        assert row[4] is None
+        assert row[6] is None
+        assert row[7] is None
+        assert row[15] is None
+        assert row[-1] == 'None Properties'
+
+    def test_missing_fields_use_defaults(self):
+        row = parse_property_row(ET.fromstring('<property><reference>REF2</reference></property>'))
+
+        assert row[6] == 'Jersey'
+        assert row[7] == 'Available'
+        assert row[8] == 'buy'
+        assert row[5] == 0.0
+        assert row[10] == 0
+
+
+class TestWritePropertyRows:
+    """Test the queue consumer that writes rows to MariaDB"""
+
+    @patch.object(feed_import, 'BATCH_SIZE', 2)
+    def test_upserts_in_batches_and_counts_new_vs_updated(self):
+        rows = [make_row(f'REF{i}') for i in range(5)]
+        cursor = FakeCursor()
+        existing = {'REF1', 'REF3'}
+
+        result = write_property_rows(cursor, queued(rows), threading.Event(), existing)
+
+        assert result == (3, 2)
+        assert [len(batch) for batch in cursor.batches] == [2, 2, 1]
+        assert [row for batch in cursor.batches for row in batch] == rows
+        assert cursor.loads == []
+        assert existing == {f'REF{i}' for i in range(5)}
+
+    def test_bulk_load_spools_rows_in_column_order(self, tmp_path):
+        rows = [make_row('REF1'), make_row('REF2', parish='St Brelade')]
+        cursor = FakeCursor()
+
+        with patch('tempfile.tempdir', str(tmp_path)):
+            result = write_property_rows(cursor, queued(rows), threading.Event(), set(), bulk_load=True)
+
+        assert result == (2, 0)
+        assert cursor.batches == []
+        assert len(cursor.loads) == 1
+        assert cursor.loads[0] == [as_spooled(row) for row in rows]
+        # The spool file is removed once loaded
+        assert os.listdir(tmp_path) == []
+
+    def test_spool_line_uses_load_data_escapes(self):
+        line = spool_line(('REF1', None, 'a\tb\nc\\d', 2, 0.5))
+
+        assert line == 'REF1\t\\N\ta\\tb\\nc\\\\d\t2\t0.5\n'
+
+    @pytest.mark.parametrize('errno', [errorcode.ER_NOT_ALLOWED_COMMAND, errorcode.ER_CLIENT_LOCAL_FILES_DISABLED])
+    def test_bulk_load_falls_back_to_upserts_when_local_infile_is_disabled(self, errno, capsys):
+        rows = [make_row('REF1'), make_row('REF2')]
+        cursor = FakeCursor(load_error=Error(msg='The used command is not allowed', errno=errno))
+
+        result = write_property_rows(cursor, queued(rows), threading.Event(), set(), bulk_load=True)
+
+        assert result == (2, 0)
+        assert cursor.batches == [[as_spooled(row) for row in rows]]
+        assert 'LOAD DATA LOCAL INFILE is not allowed' in capsys.readouterr().out
+
+    def test_bulk_load_raises_other_errors(self):
+        cursor = FakeCursor(load_error=Error(msg='Lock wait timeout exceeded', errno=errorcode.ER_LOCK_WAIT_TIMEOUT))
+
+        with pytest.raises(Error):
+            write_property_rows(cursor, queued([make_row('REF1')]), threading.Event(), set(), bulk_load=True)
+
+        assert cursor.batches == []
+
+    @patch.object(feed_import, 'BATCH_SIZE', 2)
+    def test_write_failure_stops_and_drains_the_producer(self):
+        # A small queue would block the producer forever if the consumer stopped reading
+        row_queue = queue.Queue(maxsize=2)
+        stop_event = threading.Event()
+        cursor = FakeCursor(executemany_error=Error(msg='Deadlock found', errno=errorcode.ER_LOCK_DEADLOCK))
+
+        def produce():
+            for i in range(50):
+                if stop_event.is_set():
+                    break
+                row_queue.put(make_row(f'REF{i}'))
+            row_queue.put(None)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        with pytest.raises(Error):
+            write_property_rows(cursor, row_queue, stop_event, set())
+        producer.join(timeout=5)
+
+        assert not producer.is_alive()
+        assert stop_event.is_set()
+        assert row_queue.empty()
+
+    @pytest.mark.parametrize('bulk_load', [False, True])
+    def test_parse_failure_writes_nothing(self, bulk_load):
+        payload = (
+            b'<?xml version="1.0"?><xml><property><reference>REF1</reference></property>'
+            b'<property><reference>REF2</reference></propertx></xml>'
+        )
+        row_queue = queue.Queue()
+        stop_event = threading.Event()
+        cursor = FakeCursor()
+
+        with pytest.raises(ET.ParseError):
+            produce_property_rows(payload, row_queue, stop_event)
+        # REF1 was queued before the error, followed by the sentinel
+        assert row_queue.qsize() == 2
+
+        write_property_rows(cursor, row_queue, stop_event, set(), bulk_load=bulk_load)
+
+        assert cursor.batches == []
+        assert cursor.loads == []
@@ -0,0 +1,108 @@
+"""
+Tests for manage_google_ads.py script
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("google.ads.googleads")
+from google.ads.googleads.client import GoogleAdsClient
+
+from scripts.manage_google_ads import ad_row_to_dict, ad_row_to_summary, alist_ads_many
+
+
+@pytest.fixture
+def client():
+    """Offline client returning raw protobuf messages, as the interactive menu uses"""
+    return GoogleAdsClient(credentials=None, developer_token="test", use_proto_plus=False)
+
+
+@pytest.fixture
+def ad_row(client):
+    """A raw GoogleAdsRow for a responsive search ad"""
+    row = client.get_type("GoogleAdsRow")
+    row.campaign.id = 11
+    row.campaign.name = "Spring"
+    row.ad_group.id = 22
+    row.ad_group.name = "Houses"
+    row.ad_group_ad.status = client.enums.AdGroupAdStatusEnum.ENABLED
+    row.ad_group_ad.policy_summary.approval_status = client.enums.PolicyApprovalStatusEnum.APPROVED
+    ad = row.ad_group_ad.ad
+    ad.id = 33
+    ad.type_ = client.enums.AdTypeEnum.RESPONSIVE_SEARCH_AD
+    ad.final_urls.append("https://example.com/")
+    headline = ad.responsive_search_ad.headlines.add()
+    headline.text = "Homes in Jersey"
+    headline.pinned_field = client.enums.ServedAssetFieldTypeEnum.HEADLINE_1
+    ad.responsive_search_ad.headlines.add().text = "Sell with us"
+    ad.responsive_search_ad.descriptions.add().text = "Free valuation"
+    return row
+
+
+class TestAdRowShaping:
+    """Test shaping raw Google Ads rows into ad dicts"""
+
+    def test_ad_row_to_summary(self, client, ad_row):
+        assert ad_row_to_summary(client, ad_row) == {
+            'id': 33,
+            'name': "Ad 33",
+            'status': 'ENABLED',
+            'type': 'RESPONSIVE_SEARCH_AD',
+            'approval_status': 'APPROVED',
+        }
+
+    def test_ad_row_to_dict(self, client, ad_row):
+        ad_info = ad_row_to_dict(client, ad_row)
+
+        assert ad_info['type'] == 'RESPONSIVE_SEARCH_AD'
+        assert ad_info['ad_group_id'] == 22
+        assert ad_info['campaign_name'] == "Spring"
+        assert ad_info['final_urls'] == ["https://example.com/"]
+        assert ad_info['final_mobile_urls'] == []
+        assert ad_info['headlines'] == [
+            {'text': "Homes in Jersey", 'pinned_field': 'HEADLINE_1'},
+            {'text': "Sell with us", 'pinned_field': None},
+        ]
+        assert ad_info['descriptions'] == [{'text': "Free valuation", 'pinned_field': None}]
+
+
+class FakeAsyncService:
+    """Async GoogleAdsService stand-in recording its queries and whether it was closed"""
+
+    def __init__(self):
+        self.queries = []
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def search_stream(self, customer_id, query):
+        assert not self.closed
+        self.queries.append((customer_id, query))
+
+        async def batches():
+            return
+            yield
+
+        return batches()
+
+
+class TestAsyncAdListing:
+    """Test the concurrent ad listing over the async service client"""
+
+    def test_alist_ads_many_closes_the_service(self):
+        service = FakeAsyncService()
+        client = Mock()
+        client.get_service.return_value = service
+
+        result = asyncio.run(alist_ads_many(client, "123-456-7890", [1, 2, 3], max_concurrency=2))
+
+        assert result == [[], [], []]
+        client.get_service.assert_called_once_with("GoogleAdsService", is_async=True)
+        assert [customer_id for customer_id, _ in service.queries] == ["1234567890"] * 3
+        assert service.closed